@@ -1,6 +1,52 @@
-from frame_fixtures.core import Fixture as Fixture #pylint: disable=W0611
-from frame_fixtures.core import parse as parse #pylint: disable=W0611
+# NOTE: names are imported from core, which imports NumPy, on first access (PEP 562); importing frame_fixtures alone imports nothing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing as tp
+    from frame_fixtures.core import Fixture as Fixture #pylint: disable=W0611
+    from frame_fixtures.core import FixturePlan as FixturePlan #pylint: disable=W0611
+    from frame_fixtures.core import LazyFrame as LazyFrame #pylint: disable=W0611
+    from frame_fixtures.core import compile as compile #pylint: disable=W0611
+    from frame_fixtures.core import parse as parse #pylint: disable=W0611
+    from frame_fixtures.core import parse_many as parse_many #pylint: disable=W0611
+    from frame_fixtures.core import iter_parse as iter_parse #pylint: disable=W0611
+    from frame_fixtures.core import write as write #pylint: disable=W0611
+    from frame_fixtures.core import share as share #pylint: disable=W0611
+    from frame_fixtures.core import attach as attach #pylint: disable=W0611
+    from frame_fixtures.core import detach as detach #pylint: disable=W0611
+    from frame_fixtures.core import parse_cache as parse_cache #pylint: disable=W0611
+    from frame_fixtures.core import array_cache as array_cache #pylint: disable=W0611
+    from frame_fixtures.core import profile as profile #pylint: disable=W0611
+    from frame_fixtures.core import profile_hooks as profile_hooks #pylint: disable=W0611
+    from frame_fixtures.core import warmup as warmup #pylint: disable=W0611
 
-__version__ = '1.1.0'
+__version__ = '1.2.0'
 
+_EXPORTS = frozenset((
+        'Fixture',
+        'FixturePlan',
+        'LazyFrame',
+        'compile',
+        'parse',
+        'parse_many',
+        'iter_parse',
+        'write',
+        'share',
+        'attach',
+        'detach',
+        'parse_cache',
+        'array_cache',
+        'profile',
+        'profile_hooks',
+        'warmup',
+        ))
 
+def __getattr__(name: str) -> object:
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    from frame_fixtures import core
+    value = getattr(core, name)
+    globals()[name] = value # later access does not call __getattr__
+    return value
+
+def __dir__() -> 'tp.List[str]':
+    return sorted(globals().keys() | _EXPORTS)
@@ -2,15 +2,27 @@ from __future__ import annotations
 
 import typing as tp
 from types import ModuleType
-import ast
+import os
+import operator
+import pickle
+import io
+import threading
+import weakref
+from collections import OrderedDict
 from itertools import chain
 from functools import lru_cache
 import string
-from itertools import permutations
+import re
+from keyword import iskeyword
+from math import perm
+from time import perf_counter
 
 import numpy as np
 
+# NOTE: modules not imported by NumPy, and only needed for some features, are imported where used
 if tp.TYPE_CHECKING:
+    from zipfile import ZipFile #pragma: no cover
+    from multiprocessing import shared_memory #pragma: no cover
     from static_frame import Frame #pragma: no cover
     from static_frame.core.util import TDtypeSpecifier #pragma: no cover
     from static_frame.core.container import ContainerOperand #pragma: no cover
@@ -38,6 +50,10 @@ TBuildArg = tp.Union[TBuildElement, tp.Tuple[TBuildElement]]
 TBuildType = tp.Tuple[TBuildArg, ...]
 
 TShapeType = tp.Tuple[int, int]
+TPathSpecifier = tp.Union[str, 'os.PathLike[str]']
+TBlockTask = tp.Tuple[int, 'TDtypeAny', TDtypeSpecOrSpecs, int, tp.List[int]]
+TColumnKey = tp.Tuple[TDtypeSpecOrSpecs, int, int] # dtype_spec, count, shift
+TParseKey = tp.Tuple[tp.Tuple[tp.Tuple[str, TStrConstructorType], ...], tp.Optional[ModuleType], int] # components, module_sf, seed
 TIndexTypes = tp.Union['Index', 'IndexHierarchy']
 
 
@@ -52,8 +68,14 @@ DTYPE_KINDS_NO_FROMITER = ('O', 'U', 'S')
 
 DT64_UNITS = ('Y', 'M', 'D', 'h', 'm', 's', 'ms', 'us', 'ns')
 
+WRITE_FORMATS = ('npz', 'parquet', 'arrow')
+
 COUNT_INIT = 100_000 # will be doubled on first usage
-EMPTY_ARRAY: TNDArrayAny = np.array(())
+SEED = 22 # seed of the default primitives, shuffled with the legacy RandomState
+ARRAY_CACHE_NBYTES = 268_435_456 # default bytes of arrays retained by array_cache
+NBYTES_OBJECT = 64 # estimate of the bytes of an object referenced by an object array
+CHUNK_ROWS = 100_000 # default rows created at a time when not creating a full Frame
+PROFILE_KINDS = ('phase', 'column', 'cache', 'growth')
 
 
 #-------------------------------------------------------------------------------
@@ -98,6 +120,280 @@ def repeat_count(iter: tp.Iterable[T],
         for _ in range(count):
             yield v
 
+#-------------------------------------------------------------------------------
+class CacheInfo(tp.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    nbytes: int
+    max_nbytes: int
+
+
+class NBytesCache:
+    '''A least-recently-used mapping, bounded by the sum of the `nbytes` of its values. A `max_nbytes` of zero disables the cache.
+    '''
+    def __init__(self, max_nbytes: int = 0):
+        self._lock = threading.Lock()
+        self._store: tp.OrderedDict[tp.Hashable, tp.Tuple[tp.Any, int]] = OrderedDict()
+        self._max_nbytes = max_nbytes
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_nbytes(self) -> int:
+        return self._max_nbytes
+
+    def configure(self, max_nbytes: int) -> None:
+        '''Set the maximum bytes held; values are evicted if necessary.
+        '''
+        if max_nbytes < 0:
+            raise ValueError(f'max_nbytes {max_nbytes} is < 0')
+        with self._lock:
+            self._max_nbytes = max_nbytes
+            self._evict(0)
+
+    def _evict(self, nbytes: int) -> None:
+        '''Evict least-recently-used values until `nbytes` can be added within the limit. Caller must hold the lock.
+        '''
+        while self._store and self._nbytes + nbytes > self._max_nbytes:
+            _, (_, nbytes_evicted) = self._store.popitem(last=False)
+            self._nbytes -= nbytes_evicted
+            self._evictions += 1
+
+    def get(self, key: tp.Hashable) -> tp.Any:
+        '''Return the value for `key`, or None if not found.
+        '''
+        with self._lock:
+            try:
+                value, _ = self._store[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._store.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: tp.Hashable, value: tp.Any, nbytes: int) -> None:
+        '''Store `value` for `key`; values larger than `max_nbytes` are not stored.
+        '''
+        with self._lock:
+            self._set(key, value, nbytes)
+
+    def _set(self, key: tp.Hashable, value: tp.Any, nbytes: int) -> None:
+        '''Caller must hold the lock.
+        '''
+        if key in self._store:
+            _, nbytes_prior = self._store.pop(key)
+            self._nbytes -= nbytes_prior
+        if nbytes > self._max_nbytes:
+            return
+        self._evict(nbytes)
+        self._store[key] = (value, nbytes)
+        self._nbytes += nbytes
+
+    def discard(self, predicate: tp.Callable[[tp.Hashable], bool]) -> None:
+        '''Remove the values of all keys for which `predicate` is True; counters are retained.
+        '''
+        with self._lock:
+            for key in [key for key in self._store if predicate(key)]:
+                _, nbytes = self._store.pop(key)
+                self._nbytes -= nbytes
+
+    def clear(self) -> None:
+        '''Remove all values and reset counters.
+        '''
+        with self._lock:
+            self._store.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                    hits=self._hits,
+                    misses=self._misses,
+                    evictions=self._evictions,
+                    currsize=len(self._store),
+                    nbytes=self._nbytes,
+                    max_nbytes=self._max_nbytes,
+                    )
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+class ArrayCache(NBytesCache):
+    '''
+    An NBytesCache of immutable arrays by dtype specifier, shift, and seed. As values are determined by position, one canonical array is kept for each, grown as larger counts are requested; smaller counts are returned as prefix views.
+    '''
+    @staticmethod
+    def _array_nbytes(array: TNDArrayAny) -> int:
+        if array.dtype.kind == 'O':
+            return array.nbytes + len(array) * NBYTES_OBJECT
+        return array.nbytes
+
+    def get_array(self,
+            dtype_spec: TDtypeSpecOrSpecs,
+            count: int,
+            shift: int,
+            seed: int = SEED,
+            ) -> tp.Optional[TNDArrayAny]:
+        '''Return an array of at most `count` values, or None if no array is stored. Fewer than `count` values, counted as a miss, are returned if the stored array is shorter.
+        '''
+        key = (dtype_spec, shift, seed)
+        with self._lock:
+            value = self._store.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._store.move_to_end(key)
+            array: TNDArrayAny = value[0]
+            if len(array) < count:
+                self._misses += 1
+                return array
+            self._hits += 1
+        return array if len(array) == count else array[:count]
+
+    def set_array(self,
+            dtype_spec: TDtypeSpecOrSpecs,
+            shift: int,
+            array: TNDArrayAny,
+            seed: int = SEED,
+            ) -> None:
+        '''Store `array`, unless an array of at least as many values is stored.
+        '''
+        key = (dtype_spec, shift, seed)
+        with self._lock:
+            value = self._store.get(key)
+            if value is not None and len(value[0]) >= len(array):
+                return
+            self._set(key, array, self._array_nbytes(array))
+
+
+#-------------------------------------------------------------------------------
+class ProfileEvent(tp.NamedTuple):
+    kind: str # one of PROFILE_KINDS
+    name: str
+    seconds: float
+    nbytes: int
+
+TProfileHook = tp.Callable[[ProfileEvent], None]
+
+class ProfileHooks:
+    '''
+    Callables given a ProfileEvent for each phase of creating a Frame, each column created, each cache lookup, and each growth of primitives. When no hooks are added, no events are created and nothing is timed.
+    '''
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # a new tuple is published on change, such that readers need no lock
+        self.hooks: tp.Tuple[TProfileHook, ...] = ()
+
+    def add(self, hook: TProfileHook) -> None:
+        with self._lock:
+            self.hooks = self.hooks + (hook,)
+
+    def remove(self, hook: TProfileHook) -> None:
+        '''Remove one addition of `hook`; raises ValueError if not added.
+        '''
+        with self._lock:
+            hooks = list(self.hooks)
+            hooks.remove(hook)
+            self.hooks = tuple(hooks)
+
+    def emit(self,
+            kind: str,
+            name: str,
+            seconds: float = 0.0,
+            nbytes: int = 0,
+            ) -> None:
+        event = ProfileEvent(kind, name, seconds, nbytes)
+        for hook in self.hooks:
+            hook(event)
+
+    def lap(self,
+            name: str,
+            clock: float,
+            nbytes: int = 0,
+            ) -> float:
+        '''Emit a phase event for the time since `clock`, returning the current clock.
+        '''
+        now = perf_counter()
+        self.emit('phase', name, now - clock, nbytes)
+        return now
+
+# hooks called with events from all threads
+profile_hooks = ProfileHooks()
+
+class Profile:
+    '''
+    A context manager that, while entered, records all ProfileEvent and, if given, calls `callback` with each.
+    '''
+    __slots__ = ('events', '_callback')
+
+    def __init__(self, callback: tp.Optional[TProfileHook] = None):
+        self.events: tp.List[ProfileEvent] = []
+        self._callback = callback
+
+    def __call__(self, event: ProfileEvent) -> None:
+        self.events.append(event)
+        if self._callback is not None:
+            self._callback(event)
+
+    def __enter__(self) -> 'Profile':
+        profile_hooks.add(self)
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        profile_hooks.remove(self)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: events={len(self.events)}>'
+
+    def _select(self, kind: str) -> tp.Iterator[ProfileEvent]:
+        return (e for e in self.events if e.kind == kind)
+
+    @property
+    def phases(self) -> tp.Dict[str, float]:
+        '''Seconds of each phase, summed over all Frames created.
+        '''
+        post: tp.Dict[str, float] = {}
+        for e in self._select('phase'):
+            post[e.name] = post.get(e.name, 0.0) + e.seconds
+        return post
+
+    @property
+    def columns(self) -> tp.Tuple[ProfileEvent, ...]:
+        '''Events of each array created for columns, named by the position of the first column it fills.
+        '''
+        return tuple(self._select('column'))
+
+    @property
+    def cache(self) -> tp.Dict[str, int]:
+        '''Count of each cache lookup result, such as "array_cache.hit".
+        '''
+        post: tp.Dict[str, int] = {}
+        for e in self._select('cache'):
+            post[e.name] = post.get(e.name, 0) + 1
+        return post
+
+    @property
+    def growth(self) -> tp.Tuple[ProfileEvent, ...]:
+        '''Events of each creation of primitive integers or labels.
+        '''
+        return tuple(self._select('growth'))
+
+    @property
+    def nbytes(self) -> int:
+        '''Bytes of all arrays created for columns.
+        '''
+        return sum(e.nbytes for e in self._select('column'))
+
+
 #-------------------------------------------------------------------------------
 def get_str_to_constructor(
         module_sf: tp.Optional[ModuleType],
@@ -200,6 +496,7 @@ class StrToTypeInterface:
             import static_frame as sf
             module_sf = sf
 
+        self.module_sf = module_sf
         self._constructor_specifiers = get_str_to_constructor(module_sf)
         self._dtype_specifiers = get_str_to_dtype()
 
@@ -210,6 +507,15 @@ class StrToTypeInterface:
                 self._dtype_specifiers.items()
                 ))
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def from_module(cls,
+            module_sf: tp.Optional[ModuleType] = None,
+            ) -> 'StrToTypeInterface':
+        '''Return a shared instance per module; as instances are not mutated after creation, they can be reused.
+        '''
+        return cls(module_sf)
+
     def __getitem__(self, key: str) -> tp.Type[tp.Any]:
         try:
             return self._map[key]
@@ -217,68 +523,508 @@ class StrToTypeInterface:
             raise FrameFixtureSyntaxError(f'{key!r} is not a valid specifier. Choose a constructor specifier ({", ".join(self._constructor_specifiers.keys())}) or a dtype specifier ({", ".join(self._dtype_specifiers.keys())})') from None
 
 #-------------------------------------------------------------------------------
+# a cache of arrays created by SourceValues.dtype_spec_to_array
+array_cache = ArrayCache(ARRAY_CACHE_NBYTES)
+
+class PrimitiveSegment:
+    '''Primitives for a contiguous range of absolute positions. Integers are always present; characters, bytes, and the ends of groups of the object sequence are populated on first use.
+    '''
+    __slots__ = (
+            'start',
+            'stop',
+            'ints',
+            'chars',
+            'bytes',
+            'group_ends',
+            )
+
+    def __init__(self,
+            start: int,
+            stop: int,
+            ints: TNDArrayAny,
+            ):
+        self.start = start
+        self.stop = stop
+        self.ints = ints
+        self.chars: tp.Optional[TNDArrayAny] = None
+        self.bytes: tp.Optional[TNDArrayAny] = None
+        self.group_ends: tp.Optional[TNDArrayAny] = None
+
+
 class SourceValues:
-    _SEED = 22
+    '''
+    The primitives from which all values are derived. Class attributes hold the store of the default seed; `from_seed` returns a subclass holding an independent store for another seed.
+    '''
+    _SEED = SEED
     _COUNT = 0 # current count; this values is mutated
 
-    _INTS = EMPTY_ARRAY # will be a numpy array of int64
+    # segments are appended on growth and never replaced, such that values at any position never change; a new tuple is published, under the lock, before the count, such that readers need no lock
+    _SEGMENTS: tp.Tuple[PrimitiveSegment, ...] = ()
+    _LOCK = threading.Lock()
     _INTS_DTYPE = np.dtype(np.int64)
-    _CHARS = EMPTY_ARRAY
-    _BYTES = EMPTY_ARRAY
 
     _SIG_DIGITS = 12
 
-    _LABEL_ALPHABET = permutations(
-            chain(reversed(string.ascii_lowercase),
+    _CACHE_DIR: tp.Optional[str] = os.environ.get('FRAME_FIXTURES_CACHE_DIR') or None
+
+    _LABEL_ALPHABET = np.frombuffer(''.join(chain(
+            reversed(string.ascii_lowercase),
             string.ascii_uppercase,
-            string.digits), 4)
+            string.digits)).encode(), dtype=np.uint8)
+    _LABEL_SIZE = 4
     # 62 options in groups of 4 gives 13,388,280 permutations
+    _LABEL_COUNT = perm(len(_LABEL_ALPHABET), _LABEL_SIZE)
+
+    # stores of seeds other than SEED, created on first use
+    _STORES: tp.Dict[int, tp.Type['SourceValues']] = {}
+
+    @classmethod
+    def from_seed(cls, seed: tp.Optional[int] = None) -> tp.Type['SourceValues']:
+        '''Return the store of primitives for `seed`, creating it on first use. If `seed` is None or SEED, the default store is returned.
+        '''
+        if seed is None:
+            return SourceValues
+        try:
+            # NumPy integers are accepted; Booleans are not
+            value = -1 if isinstance(seed, (bool, np.bool_)) else operator.index(seed)
+        except TypeError:
+            value = -1
+        if value < 0:
+            raise ValueError(f'seed must be a non-negative integer: {seed!r}')
+        seed = value
+        if seed == SEED:
+            return SourceValues
+        store = SourceValues._STORES.get(seed)
+        if store is None:
+            with SourceValues._LOCK:
+                store = SourceValues._STORES.get(seed)
+                if store is None:
+                    store = type(f'SourceValues{seed}', (SourceValues,), {
+                            '_SEED': seed,
+                            '_COUNT': 0,
+                            '_SEGMENTS': (),
+                            '_LOCK': threading.Lock(),
+                            })
+                    SourceValues._STORES[seed] = store
+        return store
+
+    @classmethod
+    def clear_stores(cls) -> None:
+        '''Release the stores of all seeds other than SEED, and the arrays and Frames cached from them; a store is created again by a later call to `from_seed`.
+        '''
+        with SourceValues._LOCK:
+            SourceValues._STORES.clear()
+        # a store created again may grow differently, so values cached from the released stores are discarded; keys of both caches end with the seed
+        array_cache.discard(lambda key: key[-1] != SEED) # type: ignore
+        parse_cache.discard(lambda key: key[-1] != SEED) # type: ignore
+
+    @classmethod
+    def reset(cls) -> None:
+        '''Discard the primitives of the default store and the stores of all other seeds, and the arrays and Frames cached from them, such that later fixtures are created as in a new process. If a cache directory is set, primitives are loaded from it.
+        '''
+        with SourceValues._LOCK:
+            SourceValues._SEGMENTS = ()
+            SourceValues._COUNT = 0
+        cls.clear_stores()
+        # values depend on the growth of primitives, so values created before are discarded
+        array_cache.clear()
+        parse_cache.clear()
 
     @classmethod
     def shuffle(cls, mutable: TNDArrayAny) -> None:
-        state = np.random.get_state()
-        np.random.seed(cls._SEED)
-        np.random.shuffle(mutable)
-        np.random.set_state(state)
+        if cls._SEED == SEED:
+            # NOTE: equivalent to seeding the global RandomState, without mutating state shared by other threads
+            np.random.RandomState(SEED).shuffle(mutable)
+        else:
+            np.random.default_rng(cls._SEED).shuffle(mutable)
+
+    @classmethod
+    def _ranks_to_codes(cls,
+            ranks: TNDArrayAny,
+            ) -> TNDArrayAny:
+        '''Given an array of ranks, return a 2D array of the character codes of the labels found at those positions in the lexicographic ordering of permutations of the label alphabet.
+        '''
+        if len(ranks) and ranks.max() >= cls._LABEL_COUNT:
+            raise ValueError(f'label alphabet exhausted: cannot provide more than {cls._LABEL_COUNT} labels')
+
+        size = len(cls._LABEL_ALPHABET)
+        positions = np.empty((len(ranks), cls._LABEL_SIZE), dtype=np.uint8)
+        remainder = ranks
+
+        for i in range(cls._LABEL_SIZE):
+            # each value at position i is followed by this many permutations of the remaining values
+            digit, remainder = np.divmod(
+                    remainder,
+                    perm(size - i - 1, cls._LABEL_SIZE - i - 1),
+                    )
+            # skip alphabet positions already used, taken in ascending order
+            for used in np.sort(positions[:, :i], axis=1).T:
+                digit += digit >= used
+            positions[:, i] = digit
+
+        return cls._LABEL_ALPHABET[positions]
+
+    @staticmethod
+    def _codes_to_chars(codes: TNDArrayAny) -> TNDArrayAny:
+        return codes.astype(np.uint32).view(DTYPE_STR).reshape(len(codes))
+
+    @staticmethod
+    def _codes_to_bytes(codes: TNDArrayAny) -> TNDArrayAny:
+        return codes.view(DTYPE_BYTES).reshape(len(codes))
 
     @classmethod
-    def _ints_to_chars(cls,
+    def _ints_to_codes(cls,
             array: TNDArrayAny,
             offset: int = 0,
             ) -> TNDArrayAny:
+        '''Assign label codes in permutation order to the positions given by the values of `array`, where label ranks continue from `offset`.
+        '''
+        ranks = np.empty(len(array), dtype=cls._INTS_DTYPE)
+        ranks[array - offset] = np.arange(offset,
+                offset + len(array),
+                dtype=cls._INTS_DTYPE,
+                )
+        return cls._ranks_to_codes(ranks)
+
+    #---------------------------------------------------------------------------
+    @classmethod
+    def set_cache_dir(cls, fp: tp.Optional[str]) -> None:
+        '''Set a directory in which primitives are persisted as NPY files and from which they are memory-mapped by later processes; provide None to disable. The initial value is taken from the environment variable FRAME_FIXTURES_CACHE_DIR.
+        '''
+        cls._CACHE_DIR = fp
+
+    @classmethod
+    def _cache_fp(cls, start: int, stop: int, kind: str) -> str:
+        from frame_fixtures import __version__
+
+        assert cls._CACHE_DIR is not None
+        # NOTE: the stream of RandomState, used for SEED, is stable across NumPy versions; that of Generator, used for other seeds, is not
+        version = '' if cls._SEED == SEED else f'-np{np.__version__}'
+        return os.path.join(cls._CACHE_DIR,
+                f'ff-{__version__}-seed{cls._SEED}{version}-{start}-{stop}-{kind}.npy',
+                )
+
+    @staticmethod
+    def _cache_load(
+            fp: str,
+            dtype: TDtypeAny,
+            count: int,
+            ) -> tp.Optional[TNDArrayAny]:
+        '''Return a memory-mapped, immutable array if found and valid, else None.
+        '''
+        try:
+            array = np.load(fp, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        if array.dtype != dtype or array.shape != (count,):
+            return None # reject stale or corrupt files
+        return np.asarray(array) # a view without the memmap subclass
+
+    @staticmethod
+    def _cache_store(fp: str, array: TNDArrayAny) -> None:
+        '''Persist `array` if possible; as the cache is optional, failure to write is ignored and primitives remain in memory.
+        '''
+        # write to a unique temporary file and rename so that concurrent readers never see a partial file
+        fp_temp = f'{fp}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(fp), exist_ok=True)
+            with open(fp_temp, 'wb') as f:
+                np.save(f, array, allow_pickle=False)
+            os.replace(fp_temp, fp)
+        except OSError:
+            try:
+                os.remove(fp_temp)
+            except OSError:
+                pass
+
+    @classmethod
+    def _primitives_segment(cls,
+            start: int,
+            stop: int,
+            ) -> PrimitiveSegment:
+        '''Return a segment of primitives for positions `start` to `stop`, where integers are a shuffled range. A segment depends only on `start` and `stop`, not on any other segment.
+        '''
+        fp = None
+        if cls._CACHE_DIR:
+            fp = cls._cache_fp(start, stop, 'ints')
+            ints = cls._cache_load(fp, cls._INTS_DTYPE, stop - start)
+            if ints is not None:
+                return PrimitiveSegment(start, stop, ints)
+
+        ints = np.arange(start, stop, dtype=cls._INTS_DTYPE)
+        cls.shuffle(ints)
+        ints.flags.writeable = False
+
+        if fp:
+            cls._cache_store(fp, ints)
+        return PrimitiveSegment(start, stop, ints)
+
+    @classmethod
+    def _segment_labels(cls, segment: PrimitiveSegment) -> None:
+        '''Populate characters and bytes of a segment, where label ranks continue from the start of the segment.
+        '''
+        if segment.chars is not None:
+            return
+        clock = perf_counter() if profile_hooks.hooks else 0.0
+        with cls._LOCK:
+            if segment.chars is not None: # populated by another thread
+                return
+            cls._segment_labels_create(segment)
+        if profile_hooks.hooks: # emitted without the lock
+            profile_hooks.emit('growth',
+                    f'labels[{segment.start}:{segment.stop}]',
+                    perf_counter() - clock,
+                    segment.chars.nbytes + segment.bytes.nbytes, # type: ignore
+                    )
 
-        values_char = np.empty(len(array), dtype=DTYPE_STR)
-        for i, v in enumerate(array):
-            values_char[v - offset] = ''.join(next(cls._LABEL_ALPHABET))
+    @classmethod
+    def _segment_labels_create(cls, segment: PrimitiveSegment) -> None:
+        '''Caller must hold the lock. Bytes are published before characters, as populated segments are identified by characters.
+        '''
+        count = segment.stop - segment.start
+        fps = None
+        if cls._CACHE_DIR:
+            fps = (cls._cache_fp(segment.start, segment.stop, 'chars'),
+                    cls._cache_fp(segment.start, segment.stop, 'bytes'),
+                    )
+            chars = cls._cache_load(fps[0], DTYPE_STR, count)
+            bytes_ = cls._cache_load(fps[1], DTYPE_BYTES, count)
+            if chars is not None and bytes_ is not None:
+                segment.bytes = bytes_
+                segment.chars = chars
+                return
+
+        codes = cls._ints_to_codes(segment.ints, offset=segment.start)
+        chars = cls._codes_to_chars(codes)
+        bytes_ = cls._codes_to_bytes(codes)
+        chars.flags.writeable = False
+        bytes_.flags.writeable = False
+
+        if fps:
+            cls._cache_store(fps[0], chars)
+            cls._cache_store(fps[1], bytes_)
+        segment.bytes = bytes_
+        segment.chars = chars
 
-        return values_char
+    @classmethod
+    def _segment_array(cls,
+            segment: PrimitiveSegment,
+            kind: str,
+            ) -> TNDArrayAny:
+        if kind != 'ints':
+            cls._segment_labels(segment)
+        return getattr(segment, kind) # type: ignore
 
     @classmethod
     def update_primitives(cls, count: int = COUNT_INIT) -> None:
         '''Update fixed sequences integers, characters.
         '''
         count = max(count, COUNT_INIT)
+        if count <= cls._COUNT: # without the lock if no growth is needed
+            return
+
+        events = []
+        with cls._LOCK:
+            # NOTE: if count is more than 2x of cls._COUNT, grow in 2x iteations to always match growth done incrementall
+            while count > cls._COUNT:
+                stop = count * 2
+                clock = perf_counter()
+                segment = cls._primitives_segment(cls._COUNT, stop)
+                events.append((f'ints[{segment.start}:{stop}]', perf_counter() - clock, segment.ints.nbytes))
+                cls._SEGMENTS = cls._SEGMENTS + (segment,)
+                cls._COUNT = stop
+        if profile_hooks.hooks: # emitted without the lock
+            for name, seconds, nbytes in events:
+                profile_hooks.emit('growth', name, seconds, nbytes)
+
+    @classmethod
+    def update_labels(cls, count: int = COUNT_INIT) -> None:
+        '''Update primitives for `count` and create the labels of all segments, which are otherwise created when first needed.
+        '''
+        cls.update_primitives(count)
+        for segment in cls._SEGMENTS:
+            cls._segment_labels(segment)
+
+    @classmethod
+    def _primitives_slice(cls,
+            kind: str,
+            start: int,
+            stop: int,
+            ) -> TNDArrayAny:
+        '''Return primitives of `kind` (one of "ints", "chars", or "bytes") from absolute positions `start` to `stop`, growing primitives only if `stop` exceeds what is available. If the positions are within one segment, an immutable view is returned.
+        '''
+        if stop > cls._COUNT:
+            cls.update_primitives(stop)
+
+        parts = []
+        for segment in cls._SEGMENTS: # a snapshot published with or before the count
+            if segment.stop <= start:
+                continue
+            if segment.start >= stop:
+                break
+            parts.append(cls._segment_array(segment, kind)[
+                    max(start, segment.start) - segment.start:
+                    min(stop, segment.stop) - segment.start
+                    ])
+
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return np.empty(0, dtype={
+                    'ints': cls._INTS_DTYPE,
+                    'chars': DTYPE_STR,
+                    'bytes': DTYPE_BYTES,
+                    }[kind])
+        array: TNDArrayAny = np.concatenate(parts)
+        array.flags.writeable = False
+        return array
+
+    @classmethod
+    def _primitives_iter(cls, kind: str) -> tp.Iterator[tp.Any]:
+        '''Iterate over all primitives of `kind` currently available.
+        '''
+        for segment in cls._SEGMENTS:
+            yield from cls._segment_array(segment, kind)
+
+    @classmethod
+    def _ints_slice(cls, start: int, stop: int) -> TNDArrayAny:
+        return cls._primitives_slice('ints', start, stop)
+
+    @classmethod
+    def _chars_slice(cls, start: int, stop: int) -> TNDArrayAny:
+        return cls._primitives_slice('chars', start, stop)
+
+    @classmethod
+    def _bytes_slice(cls, start: int, stop: int) -> TNDArrayAny:
+        return cls._primitives_slice('bytes', start, stop)
+
+    @classmethod
+    def _floats(cls, start: int, count: int) -> TNDArrayAny:
+        '''Return `count` values of the float sequence (a leading NaN followed by scaled integers) from position `start`.
+        '''
+        array = np.empty(count, dtype=DTYPE_FLOAT)
+        lead = 1 if start == 0 and count else 0
+        ints = cls._ints_slice(start + lead - 1, start + count - 1)
+        # NOTE: np.round is the implementation used by round() on NumPy floats
+        array[lead:] = np.round(
+                ints * np.where(ints % 3 == 0, -0.02, 0.02),
+                cls._SIG_DIGITS,
+                )
+        if lead:
+            array[0] = np.nan
+        return array
 
-        # NOTE: if count is more than 2x of cls._COUNT, grow in 2x iteations to always match growth done incrementall
-        while count > cls._COUNT:
-            cls._COUNT = count * 2
+    @classmethod
+    def _objects_group(cls, q_start: int) -> tp.Tuple[int, int]:
+        '''Return the index of the group of the object sequence that includes `q_start` (a position relative to the first group), and the position at which that group starts. The ends of groups are cached per segment, such that, once cached, the cost does not grow with `q_start`. Primitives must have been grown for the group.
+        '''
+        end = 0 # the end of the groups of prior segments
+        for segment in cls._SEGMENTS:
+            if segment.group_ends is None:
+                with cls._LOCK:
+                    if segment.group_ends is None: # populated by another thread
+                        group_ends = np.cumsum((segment.ints % 3 + 1) * 3) + end
+                        group_ends.flags.writeable = False
+                        segment.group_ends = group_ends
+            group_ends = segment.group_ends
+            if group_ends[-1] > q_start:
+                g = int(np.searchsorted(group_ends, q_start, side='right'))
+                return segment.start + g, (int(group_ends[g - 1]) if g else end)
+            end = int(group_ends[-1])
+        raise RuntimeError(f'primitives not grown for position {q_start}')
+
+    @classmethod
+    def _objects(cls, start: int, count: int) -> TNDArrayAny:
+        '''Return `count` values of the object sequence from position `start`. After None, True, and False, the sequence is made of groups, one per integer `i`, of `i % 3 + 1` integers, then as many floats, then as many strings, each taken in turn from its own sequence.
+        '''
+        array = np.empty(count, dtype=DTYPE_OBJECT)
+        stop = start + count
+        for pos in range(start, min(stop, 3)):
+            array[pos - start] = (None, True, False)[pos]
+        if stop <= 3:
+            return array
+
+        # positions relative to the first group
+        q_start = max(start, 3) - 3
+        q_stop = stop - 3
+        # as every group has at least three values, primitives for this many groups are sufficient
+        count_group = -(-q_stop // 3)
+        if count_group > cls._COUNT:
+            cls.update_primitives(count_group)
+        g_start, group_start = cls._objects_group(q_start)
+        # groups from g_start; as many as values from group_start are sufficient
+        repeats = cls._ints_slice(g_start, g_start + -(-(q_stop - group_start) // 3)) % 3 + 1
+        ends = group_start + np.cumsum(repeats * 3)
+        g_stop = int(np.searchsorted(ends, q_stop - 1, side='right')) + 1
+
+        # the part (0 for integers, 1 for floats, 2 for strings) of each value of the groups
+        parts = np.repeat(
+                np.tile(np.arange(3), g_stop),
+                np.repeat(repeats[:g_stop], 3),
+                )
+        offset = q_start - group_start
+        parts = parts[offset: offset + q_stop - q_start]
+
+        target = array[max(start, 3) - start:]
+        repeat = int(repeats[0])
+        for part, shift in ((0, 10), (1, 100), (2, 50)):
+            is_part = parts == part
+            count_part = int(is_part.sum())
+            if not count_part:
+                continue
+            # each group takes as many values from each sequence; skip values of this part before `q_start`
+            position = group_start // 3 + min(max(offset - part * repeat, 0), repeat) + shift
+            if part == 0:
+                values = cls._dtype_to_array_vector(DTYPE_INT, count_part, position)
+            elif part == 1:
+                values = cls._floats(position, count_part)
+            else:
+                values = cls._chars_slice(position, position + count_part)
+            # NOTE: a list retains NumPy scalars as values
+            target[is_part] = list(values)
+        return array
 
-            if not len(cls._INTS):
-                values_int = np.arange(cls._COUNT, dtype=cls._INTS_DTYPE)
-                cls.shuffle(values_int)
-                cls._INTS = values_int
-                cls._CHARS = cls._ints_to_chars(cls._INTS)
-                cls._BYTES = cls._CHARS.astype(DTYPE_BYTES)
+    @classmethod
+    def _dtype_to_array_vector(cls,
+            dtype: TDtypeAny,
+            count: int,
+            shift: int,
+            ) -> TNDArrayAny:
+        '''Vectorized equivalent of taking `count` values from `dtype_to_element_iter`.
+        '''
+        array: TNDArrayAny
+        kind = dtype.kind
+
+        if kind == 'i':
+            ints = cls._ints_slice(shift, shift + count)
+            array = ints.astype(dtype)
+            np.negative(array, out=array, where=ints % 3 == 0)
+        elif kind == 'u':
+            array = cls._ints_slice(shift + 100, shift + 100 + count).astype(dtype)
+        elif kind == 'f':
+            array = cls._floats(shift, count).astype(dtype, copy=False)
+        elif kind == 'c':
+            array = np.empty(count, dtype=DTYPE_COMPLEX)
+            array.real = cls._floats(shift, count)
+            array.imag = cls._floats(shift + 100, count)
+            array = array.astype(dtype, copy=False)
+        elif kind == 'b':
+            array = cls._ints_slice(shift, shift + count) % 2 == 0
+        elif kind in ('U', 'S'):
+            if not count: # an unsized dtype is discovered as size 1
+                array = np.array((), dtype=dtype)
+            elif kind == 'U':
+                array = cls._chars_slice(shift, shift + count).astype(dtype)
             else:
-                offset = len(cls._INTS)
-                values_ext = np.arange(offset, cls._COUNT, dtype=cls._INTS_DTYPE)
-                cls.shuffle(values_ext)
-                cls._INTS = np.concatenate((cls._INTS, values_ext))
-                cls._CHARS = np.concatenate((
-                        cls._CHARS,
-                        cls._ints_to_chars(values_ext, offset=offset),
-                        ))
-                cls._BYTES = cls._CHARS.astype(DTYPE_BYTES)
+                array = cls._bytes_slice(shift, shift + count).astype(dtype)
+        elif kind in ('M', 'm'):
+            array = cls._ints_slice(shift, shift + count).astype(dtype)
+        elif kind == 'O':
+            array = cls._objects(shift, count)
+        else:
+            raise NotImplementedError(f'no handling for {dtype}')
+
+        return array
 
     @classmethod
     def dtype_to_element_iter(cls,
@@ -292,22 +1038,22 @@ class SourceValues:
         if dtype.kind == 'i': # int
             if dtype == cls._INTS_DTYPE:
                 def gen() -> tp.Iterator[tp.Any]:
-                    for v in cls._INTS:
+                    for v in cls._primitives_iter('ints'):
                         yield v * (-1 if v % 3 == 0 else 1)
             else:
                 def gen() -> tp.Iterator[tp.Any]:
-                    for v in cls._INTS:
+                    for v in cls._primitives_iter('ints'):
                         # NOTE: have to astype here with NumPy2, as fromiter rejects casting
                         yield v.astype(dtype) * (-1 if v % 3 == 0 else 1)
 
         elif dtype.kind == 'u': # int unsigned
             def gen() -> tp.Iterator[tp.Any]:
-                yield from iter_shift(cls._INTS, 100)
+                yield from iter_shift(cls._primitives_iter('ints'), 100)
 
         elif dtype.kind == 'f': # float
             def gen() -> tp.Iterator[tp.Any]:
                 yield np.nan
-                for v in cls._INTS:
+                for v in cls._primitives_iter('ints'):
                     # round to avoid tiny floating-point noise
                     if v % 3 == 0:
                         yield round(v * -0.02, cls._SIG_DIGITS)
@@ -330,16 +1076,16 @@ class SourceValues:
 
         elif dtype.kind == 'b': # boolean
             def gen() -> tp.Iterator[tp.Any]:
-                for v in cls._INTS:
+                for v in cls._primitives_iter('ints'):
                     yield v % 2 == 0
 
         elif dtype.kind  == 'U': # str
             def gen() -> tp.Iterator[tp.Any]:
-                yield from cls._CHARS
+                yield from cls._primitives_iter('chars')
 
         elif dtype.kind == 'S': # bytes
             def gen() -> tp.Iterator[tp.Any]:
-                yield from cls._BYTES
+                yield from cls._primitives_iter('bytes')
 
         elif dtype.kind == 'O': # object
             def gen() -> tp.Iterator[tp.Any]:
@@ -363,20 +1109,20 @@ class SourceValues:
                                 shift=50,
                                 ),
                         )
-                for i in cls._INTS:
+                for i in cls._primitives_iter('ints'):
                     for gen in gens:
                         # return at most 3 values from the gen
                         yield from take_count(gen, (i % 3) + 1)
 
         elif dtype.kind == 'M': # datetime64
             def gen() -> tp.Iterator[tp.Any]:
-                for v in cls._INTS:
+                for v in cls._primitives_iter('ints'):
                     # NOTE: numpy ints, can use astype
                     yield v.astype(dtype)
 
         elif dtype.kind == 'm': # timedelta64
             def gen() -> tp.Iterator[tp.Any]:
-                for v in cls._INTS:
+                for v in cls._primitives_iter('ints'):
                     yield v.astype(dtype)
 
         else:
@@ -402,11 +1148,11 @@ class SourceValues:
             gen: optionally supply a generator of values
         '''
         if not gen:
-            gen = cls.dtype_to_element_iter(
-                    dtype,
-                    count=count,
-                    shift=shift,
-                    )
+            # NOTE: update with count first to match growth done by dtype_to_element_iter
+            cls.update_primitives(count)
+            array = cls._dtype_to_array_vector(dtype, count=count, shift=shift)
+            array.flags.writeable = False
+            return array
 
         if dtype.kind not in DTYPE_KINDS_NO_FROMITER:
             array = np.fromiter(gen, count=count, dtype=dtype)
@@ -420,29 +1166,154 @@ class SourceValues:
         array.flags.writeable = False
         return array
 
+    @staticmethod
+    def dtype_spec_to_dtype(
+            dtype_spec: TDtypeSpecOrSpecs,
+            count: int = COUNT_INIT,
+            ) -> TDtypeAny:
+        '''Return the dtype of the array returned by `dtype_spec_to_array`.
+        '''
+        if isinstance(dtype_spec, tuple):
+            return DTYPE_OBJECT
+        dtype = np.dtype(dtype_spec)
+        if dtype.kind in ('U', 'S') and not dtype.itemsize:
+            if not count: # an unsized dtype is discovered as size 1
+                return np.dtype(f'{dtype.kind}1')
+            return DTYPE_STR if dtype.kind == 'U' else DTYPE_BYTES
+        return dtype
+
+    @classmethod
+    def _elements(cls,
+            dtype: TDtypeAny,
+            count: int,
+            shift: int,
+            ) -> tp.List[tp.Any]:
+        '''Return `count` values of `dtype_to_element_iter`, of the same types, created from arrays.
+        '''
+        kind = dtype.kind
+        if kind == 'i':
+            ints = cls._ints_slice(shift, shift + count)
+            # the type of a value of dtype multiplied by a Python int
+            dtype_product = (np.zeros(1, dtype=dtype)[0] * -1).dtype
+            return list(ints.astype(dtype).astype(dtype_product)
+                    * np.where(ints % 3 == 0, -1, 1).astype(dtype_product))
+        if kind == 'u': # not cast to dtype
+            return list(cls._ints_slice(shift + 100, shift + 100 + count))
+        if kind == 'f': # not cast to dtype
+            values = list(cls._floats(shift, count))
+            if shift == 0 and count:
+                values[0] = np.nan
+            return values
+        if kind == 'c': # Python complex
+            return cls._dtype_to_array_vector(DTYPE_COMPLEX, count, shift).tolist() # type: ignore
+        if kind in ('U', 'S'): # not cast to dtype
+            dtype = DTYPE_STR if kind == 'U' else DTYPE_BYTES
+        return list(cls._dtype_to_array_vector(dtype, count, shift))
+
+    @classmethod
+    def _tuples(cls,
+            dtype_spec: tp.Tuple['TDtypeSpecifier', ...],
+            count: int,
+            shift: int,
+            ) -> TNDArrayAny:
+        '''Return an object array of `count` tuples, one value from each of the `dtype_spec` sequences from position `shift`.
+        '''
+        gen = zip(*(cls._elements(np.dtype(dts), count, shift) for dts in dtype_spec))
+        return cls.dtype_to_array(DTYPE_OBJECT,
+                count=count,
+                shift=shift,
+                gen=gen)
+
     @classmethod
-    @lru_cache(maxsize=128)
     def dtype_spec_to_array(cls,
             dtype_spec: TDtypeSpecOrSpecs,
             count: int = COUNT_INIT,
             shift: int = 0,
             ) -> TNDArrayAny:
+        '''Return an immutable array of `count` values from position `shift`, taken as a prefix view of the canonical array in `array_cache`. If the canonical array is shorter, only the missing values are created.
+        '''
+        if not count: # an unsized dtype is discovered as size 1, not as a prefix
+            return cls._dtype_spec_to_array(dtype_spec, count, shift)
+
+        prior = array_cache.get_array(dtype_spec, count, shift, cls._SEED)
+        if prior is not None and len(prior) == count:
+            if profile_hooks.hooks:
+                profile_hooks.emit('cache', 'array_cache.hit', nbytes=prior.nbytes)
+            return prior
+        if profile_hooks.hooks:
+            profile_hooks.emit('cache', 'array_cache.miss')
+
+        # NOTE: update with count first to match growth done when creating all values
+        cls.update_primitives(count)
+        start = 0 if prior is None else len(prior)
+        array = cls._dtype_spec_to_array(dtype_spec, count - start, shift + start)
+        if prior is not None:
+            array = np.concatenate((prior, array))
+            array.flags.writeable = False
+        array_cache.set_array(dtype_spec, shift, array, cls._SEED)
+        return array
+
+    @classmethod
+    def _dtype_spec_to_array(cls,
+            dtype_spec: TDtypeSpecOrSpecs,
+            count: int,
+            shift: int,
+            ) -> TNDArrayAny:
 
         if isinstance(dtype_spec, tuple):
             # an object type of tuples
-            gen = zip(*(cls.dtype_to_element_iter(
-                    np.dtype(dts), count=count, shift=shift)
-                    for dts in dtype_spec))
-            return cls.dtype_to_array(DTYPE_OBJECT,
-                    count=count,
-                    shift=shift,
-                    gen=gen)
+            # NOTE: update with count first to match growth done by dtype_to_element_iter
+            cls.update_primitives(count)
+            return cls._tuples(dtype_spec, count, shift)
 
         return cls.dtype_to_array(np.dtype(dtype_spec),
                 count=count,
                 shift=shift,
                 )
 
+    @classmethod
+    def dtype_spec_to_structured_array(cls,
+            dtype_spec: tp.Tuple['TDtypeSpecifier', ...],
+            count: int = COUNT_INIT,
+            shift: int = 0,
+            ) -> TNDArrayAny:
+        '''
+        Return a structured array with a field for each component of a tuple `dtype_spec`, an alternative to the object array of tuples returned by `dtype_spec_to_array`. Each field has the values of `dtype_spec_to_array` for that component.
+        '''
+        arrays = [cls.dtype_to_array(
+                cls.dtype_spec_to_dtype(dts, count=count),
+                count=count,
+                shift=shift,
+                ) for dts in dtype_spec]
+        array = np.empty(count, dtype=[(f'f{i}', a.dtype) for i, a in enumerate(arrays)])
+        for i, a in enumerate(arrays):
+            array[f'f{i}'] = a
+        array.flags.writeable = False
+        return array
+
+    @classmethod
+    def dtype_spec_to_take(cls,
+            dtype_spec: TDtypeSpecOrSpecs,
+            count: int = COUNT_INIT,
+            shift: int = 0,
+            ) -> tp.Callable[[int, int], TNDArrayAny]:
+        '''
+        Return a function that, given `start` and `stop` positions, returns `dtype_spec_to_array(dtype_spec, count, shift)[start:stop]` without creating the full array.
+        '''
+        # NOTE: update with count first to match growth done by dtype_spec_to_array
+        cls.update_primitives(count)
+
+        if isinstance(dtype_spec, tuple):
+            def take_tuples(start: int, stop: int) -> TNDArrayAny:
+                return cls._tuples(dtype_spec, count=stop - start, shift=shift + start)
+            return take_tuples
+
+        dtype = np.dtype(dtype_spec)
+
+        def take(start: int, stop: int) -> TNDArrayAny:
+            return cls.dtype_to_array(dtype, count=stop - start, shift=shift + start)
+        return take
+
 #-------------------------------------------------------------------------------
 
 class FrameFixtureSyntaxError(SyntaxError):
@@ -472,6 +1343,9 @@ class Grammar:
             SHAPE: frozenset((2,)),
             }
 
+    # whitespace is permitted between any tokens
+    _TOKEN = re.compile(r'\w+|\S')
+
     SIGNATURES = {
             FRAME: '(CS,)',
             INDEX: '(CS, DS) or ((CS, ...), (DS, ...))',
@@ -502,52 +1376,178 @@ class Grammar:
     def dsl_to_str_constructors(cls,
             dsl: str,
             ) -> TStrConstructorsType:
+        '''Return a mapping of component to arguments. Validated results are cached by DSL string; each call returns a new mapping.
+        '''
+        return dict(cls._dsl_to_str_constructors(dsl))
 
-        body = ast.parse(dsl).body
-        if len(body) != 1:
-            raise FrameFixtureSyntaxError('no tokens found')
+    @classmethod
+    def _error(cls,
+            dsl: str,
+            tokens: tp.List[str],
+            i: int,
+            msg: str,
+            ) -> FrameFixtureSyntaxError:
+        '''Return an error for the token at index `i`, reported with the one-based column of that token.
+        '''
+        token = tokens[i]
+        if token and token not in '(),|' and not token[0].isalnum() and token[0] != '_':
+            msg = f'invalid character {token!r}'
+        # positions are only found when raising, as the common case does not need them
+        pos = len(dsl.rstrip())
+        for j, m in enumerate(cls._TOKEN.finditer(dsl)):
+            if j == i:
+                pos = m.start()
+                break
+        e = FrameFixtureSyntaxError(f'{msg} at column {pos + 1}: {dsl!r}')
+        e.offset = pos + 1
+        e.text = dsl
+        return e
 
-        root = body[0]
-        assert isinstance(root, ast.Expr)
+    @classmethod
+    def _word(cls,
+            dsl: str,
+            tokens: tp.List[str],
+            i: int,
+            ) -> tp.Union[str, int]:
+        '''Return the name or integer at index `i`.
+        '''
+        token = tokens[i]
+        if token.isidentifier():
+            if not token.isascii(): # normalized as Python identifiers
+                import unicodedata
+                token = unicodedata.normalize('NFKC', token)
+            if iskeyword(token):
+                raise cls._error(dsl, tokens, i, f'invalid name {token!r}')
+            return token
+        if token and token[0] in string.digits:
+            if token.isascii(): # integer literals as in Python, permitting underscores and prefixes
+                try:
+                    return int(token, 0)
+                except ValueError:
+                    pass
+            raise cls._error(dsl, tokens, i, f'invalid integer {token!r}')
+        if token and (token[0].isalnum() or token[0] == '_'):
+            raise cls._error(dsl, tokens, i, f'invalid name {token!r}')
+        raise cls._error(dsl, tokens, i, 'expected a name, integer, or tuple')
 
-        if isinstance(root.value, ast.BinOp):
-            bin_op_active: ast.BinOp = root.value
+    @classmethod
+    def _argument(cls,
+            dsl: str,
+            tokens: tp.List[str],
+            i: int,
+            ) -> tp.Tuple[TStrConstructorArg, int]:
+        '''Return a name, integer, or (possibly parenthesized) tuple starting at index `i`, and the index after it.
+        '''
+        if tokens[i] != '(':
+            return cls._word(dsl, tokens, i), i + 1 # type: ignore
+        start = i
+        i += 1
+        if tokens[i] == ')':
+            return (), i + 1
+        first, i = cls._argument(dsl, tokens, i)
+        if tokens[i] == ')': # parentheses without a comma do not form a tuple
+            return first, i + 1
+        parts = [first]
+        while tokens[i] == ',':
+            i += 1
+            if tokens[i] == ')':
+                break
+            part, i = cls._argument(dsl, tokens, i)
+            parts.append(part)
+        if tokens[i] != ')':
+            raise cls._error(dsl, tokens, i, "expected ',' or ')'")
+        if not all(isinstance(part, str) for part in parts):
+            raise cls._error(dsl, tokens, start, 'tuples can only contain names')
+        return tuple(parts), i + 1 # type: ignore
 
-            def parts() -> tp.Iterator[ast.Call]:
-                nonlocal bin_op_active
-                while True:
-                    yield tp.cast(ast.Call, bin_op_active.right) # this is a Call object
-                    if isinstance(bin_op_active.left, ast.Call):
-                        yield bin_op_active.left
-                        return
-                    bin_op_active = tp.cast(ast.BinOp, bin_op_active.left)
+    @classmethod
+    def _component(cls,
+            dsl: str,
+            tokens: tp.List[str],
+            i: int,
+            components: tp.List[tp.Tuple[str, tp.Tuple[TStrConstructorArg, ...]]],
+            ) -> int:
+        '''Append the component starting at index `i` to `components`, returning the index after it.
+        '''
+        key = cls._word(dsl, tokens, i)
+        if not isinstance(key, str):
+            raise cls._error(dsl, tokens, i, 'expected a component name')
+        if tokens[i + 1] != '(':
+            raise cls._error(dsl, tokens, i + 1, "expected '('")
+        i += 2
+        args: tp.List[TStrConstructorArg] = []
+        while tokens[i] != ')':
+            arg, i = cls._argument(dsl, tokens, i)
+            args.append(arg)
+            if tokens[i] == ',':
+                i += 1
+            elif tokens[i] != ')':
+                raise cls._error(dsl, tokens, i, "expected ',' or ')'")
+        components.append((key, tuple(args)))
+        return i + 1
 
-        elif isinstance(root.value, ast.Call):
-            def parts() -> tp.Iterator[ast.Call]:
-                yield root.value #type: ignore
+    @classmethod
+    def _operands(cls,
+            dsl: str,
+            tokens: tp.List[str],
+            i: int,
+            components: tp.List[tp.Tuple[str, tp.Tuple[TStrConstructorArg, ...]]],
+            first: bool,
+            ) -> int:
+        '''Append a component, or parenthesized components, starting at index `i`, returning the index after them. As `|` is left-associative, only the first group can have more than one component.
+        '''
+        if tokens[i] != '(':
+            return cls._component(dsl, tokens, i, components)
+        start = i
+        i = cls._operands(dsl, tokens, i + 1, components, first)
+        while tokens[i] == '|':
+            if not first:
+                raise cls._error(dsl, tokens, start, 'only the first parenthesized group can have more than one component')
+            i = cls._operands(dsl, tokens, i + 1, components, False)
+        if tokens[i] != ')':
+            raise cls._error(dsl, tokens, i, "expected '|' or ')'")
+        return i + 1
 
-        else:
-            raise FrameFixtureSyntaxError(f'no support for token {root.value}')
+    @classmethod
+    def _components(cls,
+            dsl: str,
+            tokens: tp.List[str],
+            ) -> tp.List[tp.Tuple[str, tp.Tuple[TStrConstructorArg, ...]]]:
+        '''Return each component name and arguments, in order, from `tokens` ending with an empty string.
+        '''
+        components: tp.List[tp.Tuple[str, tp.Tuple[TStrConstructorArg, ...]]] = []
+        i = cls._operands(dsl, tokens, 0, components, True)
+        while tokens[i] == '|':
+            i = cls._operands(dsl, tokens, i + 1, components, False)
+        if tokens[i]:
+            raise cls._error(dsl, tokens, i, "expected '|'")
+        return components
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _dsl_to_str_constructors(cls,
+            dsl: str,
+            ) -> TStrConstructorsType:
+        '''Parse `|`-delimited components, each a name called with arguments that are names, integers, or tuples of names, in one pass over the tokens.
+        '''
+        # splitting on whitespace after spacing punctuation is faster than a regular expression, and produces the same tokens for valid strings
+        tokens = dsl.replace('(', ' ( ').replace(')', ' ) ').replace(',', ' , ').replace('|', ' | ').split()
+        if not tokens:
+            raise FrameFixtureSyntaxError('no tokens found')
+        tokens.append('') # the end
+        try:
+            components = cls._components(dsl, tokens)
+        except FrameFixtureSyntaxError:
+            # invalid characters may not be separated from names; parse exact tokens to report the error and its column
+            tokens = cls._TOKEN.findall(dsl)
+            tokens.append('')
+            cls._components(dsl, tokens)
+            raise
+
+        # the first of repeated components is retained, in the order of the prior ast-based parser
         constructors: TStrConstructorsType = {}
-
-        for p in parts(): # each is a Call object
-            key = p.func.id #type: ignore
-
-            args: tp.List[TStrConstructorArg] = []
-            for arg in p.args:
-                if isinstance(arg, ast.Tuple):
-                    args.append(tuple(sub.id for sub in arg.elts)) #type: ignore
-                elif isinstance(arg, ast.Name):
-                    args.append(arg.id)
-                elif isinstance(arg, ast.Constant): # python 3.8
-                    args.append(arg.value)
-                elif isinstance(arg, ast.Num): # pre python 3.8
-                    args.append(arg.n) #type: ignore
-                else:
-                    raise FrameFixtureSyntaxError(f'no handling for {arg}')
-
-            constructors[key] = tuple(args)
+        for key, args in reversed(components):
+            constructors[key] = args
 
         cls.validate(constructors) # will raise
 
@@ -563,7 +1563,7 @@ class GrammarDoc:
     def container_components(
             module_sf: tp.Optional[ModuleType] = None,
             ) -> 'Frame':
-        str_to_type = StrToTypeInterface(module_sf)
+        str_to_type = StrToTypeInterface.from_module(module_sf)
 
         def records() -> tp.Iterator[tp.Tuple[tp.Any, ...]]:
             for arg, label in Grammar.KNOWN.items():
@@ -583,7 +1583,7 @@ class GrammarDoc:
     def specifiers_constructor(
             module_sf: tp.Optional[ModuleType] = None,
             ) -> 'Frame':
-        str_to_type = StrToTypeInterface(module_sf)
+        str_to_type = StrToTypeInterface.from_module(module_sf)
 
         def records() -> tp.Iterator[tp.Tuple[tp.Any, ...]]:
             for k, v in get_str_to_constructor(module_sf).items():
@@ -602,7 +1602,7 @@ class GrammarDoc:
     def specifiers_dtype(
             module_sf: tp.Optional[ModuleType] = None,
             ) -> 'Frame':
-        str_to_type = StrToTypeInterface(module_sf)
+        str_to_type = StrToTypeInterface.from_module(module_sf)
 
         def records() -> tp.Iterator[tp.Tuple[tp.Any, ...]]:
             for k, v in get_str_to_dtype().items():
@@ -618,74 +1618,307 @@ class GrammarDoc:
 
 
 #-------------------------------------------------------------------------------
+# a cache of Frames created by Fixture.parse; disabled by default
+parse_cache = NBytesCache()
+
 class Fixture:
 
     @staticmethod
-    def _build_index(
+    def _index_hierarchy_builder(
+            constructor: TConstructorOrConstructors,
+            dtype_spec: TDtypeSpecOrSpecs,
+            str_to_type: StrToTypeInterface,
+            ) -> tp.Tuple[tp.Type['IndexHierarchy'], tp.Any, tp.List[int]]:
+        '''Return the IH builder, the index constructors, and the repeat of labels for each depth.
+        '''
+        # dtype_spec must be a tuple
+        if not isinstance(dtype_spec, tuple) or len(dtype_spec) < 2:
+            raise RuntimeError('for building IH dtype_spec must be a tuple')
+
+        if isinstance(constructor, tuple):
+            if len(constructor) != len(dtype_spec):
+                raise RuntimeError('length of index_constructors must be the same as dtype_spec')
+            is_static = {c.STATIC for c in constructor}
+            assert len(is_static) == 1
+            builder = str_to_type['IH'] if is_static.pop() else str_to_type['IHg']
+            index_constructors: tp.Any = constructor
+        else:
+            builder = constructor
+            index_constructors = str_to_type['IACF']
+
+        # depth of 3 will provide repeats of 4, 2, 1
+        repeats = [(x * 2 if x > 0 else 1) for x in range(len(dtype_spec)-1, -1, -1)]
+        return builder, index_constructors, repeats
+
+    @classmethod
+    def _build_index(cls,
             count: int,
             constructor: TConstructorOrConstructors,
             dtype_spec: TDtypeSpecOrSpecs,
             str_to_type: StrToTypeInterface,
+            source: tp.Type[SourceValues] = SourceValues,
             ) -> TIndexTypes:
 
-        constructor_is_tuple = isinstance(constructor, tuple)
-
-        if constructor_is_tuple or issubclass(constructor, str_to_type['IH']): #type: ignore
-            # dtype_spec must be a tuple
+        if isinstance(constructor, tuple) or issubclass(constructor, str_to_type['IH']):
+            if count:
+                # labels of each depth are repeated into arrays; no tuples are created
+                return next(cls._iter_index(count, count, constructor, dtype_spec, str_to_type, source))
+            builder, index_constructors, _ = cls._index_hierarchy_builder(
+                    constructor,
+                    dtype_spec,
+                    str_to_type,
+                    )
+            return builder.from_labels((), index_constructors=index_constructors)
 
-            if not isinstance(dtype_spec, tuple) or len(dtype_spec) < 2:
-                raise RuntimeError('for building IH dtype_spec must be a tuple')
+        # if constructor is IndexHierarchy, this will work, as array will be a 1D array of tuples that, when given to from_labels, will work
+        array = source.dtype_spec_to_array(dtype_spec, count=count)
+        return constructor.from_labels(array) #type: ignore
 
-            if constructor_is_tuple:
-                if len(constructor) != len(dtype_spec): #type: ignore
-                    raise RuntimeError('length of index_constructors must be the same as dtype_spec')
-                is_static = {c.STATIC for c in constructor} #type: ignore
-                assert len(is_static) == 1
-                builder = str_to_type['IH'] if is_static.pop() else str_to_type['IHg']
-                index_constructors = constructor
-            else:
-                builder = constructor #type: ignore
-                index_constructors = str_to_type['IACF']
+    @classmethod
+    def _iter_index(cls,
+            count: int,
+            chunk_rows: int,
+            constructor: TConstructorOrConstructors,
+            dtype_spec: TDtypeSpecOrSpecs,
+            str_to_type: StrToTypeInterface,
+            source: tp.Type[SourceValues] = SourceValues,
+            ) -> tp.Iterator[TIndexTypes]:
+        '''Yield indices of consecutive slices, each of at most `chunk_rows` labels, of the index returned by `_build_index`.
+        '''
+        if isinstance(constructor, tuple) or issubclass(constructor, str_to_type['IH']):
+            builder, index_constructors, repeats = cls._index_hierarchy_builder(
+                    constructor,
+                    dtype_spec,
+                    str_to_type,
+                    )
+            dtypes: tp.List[tp.Optional[TDtypeAny]] = []
+            for i, (dts, repeat) in enumerate(zip(dtype_spec, repeats)): # type: ignore
+                if SourceValues.dtype_spec_to_dtype(dts, count=count).kind != 'O':
+                    dtypes.append(None)
+                    continue
+                # the dtype of a depth of objects is discovered from its labels; as no more than eight consecutive values of the object sequence are not strings, and strings are followed by other types, more than nine labels are always objects (as are tuples)
+                take = source.dtype_spec_to_take(dts, count=count, shift=10 * i)
+                labels = take(0, min(-(-count // repeat), 9))
+                dtypes.append(str_to_type['I'](list(labels)).dtype)
+
+            takes = [source.dtype_spec_to_take(dts, count=count, shift=10 * i)
+                    for i, dts in enumerate(dtype_spec)] # type: ignore
+
+            for start in range(0, count, chunk_rows):
+                stop = min(start + chunk_rows, count)
+                arrays = []
+                for take, repeat, dtype in zip(takes, repeats, dtypes):
+                    # the label at position p is at position p // repeat before repeating
+                    array = np.repeat(take(start // repeat, (stop - 1) // repeat + 1), repeat)
+                    array = array[start % repeat: start % repeat + stop - start]
+                    arrays.append(array if dtype is None else array.astype(dtype))
+                yield builder.from_values_per_depth(arrays, index_constructors=index_constructors)
+            return
+
+        take = source.dtype_spec_to_take(dtype_spec, count=count)
+        for start in range(0, count, chunk_rows):
+            yield constructor.from_labels(take(start, min(start + chunk_rows, count))) #type: ignore
 
-            # depth of 3 will provide repeats of 4, 2, 1
-            repeats = [(x * 2 if x > 0 else 1) for x in range(len(dtype_spec)-1, -1, -1)]
+    @staticmethod
+    def _shifts(
+            count_col: int,
+            source: tp.Type[SourceValues] = SourceValues,
+            ) -> tp.List[int]:
+        '''Return the shift applied to the values of each column.
+        '''
+        ints = source.dtype_to_array(DTYPE_INT, count=count_col)
+        max_shift = 100
+        return (ints % max_shift).tolist() # type: ignore
 
-            gens: tp.List[tp.Any] = []
-            for i, dts in enumerate(dtype_spec):
-                array = SourceValues.dtype_spec_to_array(dts, count=count, shift=10 * i)
-                gens.append(repeat_count(array, repeats[i]))
+    @staticmethod
+    def _block_layout(
+            dtypes: tp.Sequence[TDtypeAny],
+            ) -> tp.Tuple[tp.Tuple[TDtypeAny, int, int], ...]:
+        '''Return the dtype, start column, and stop column of each consolidated block, grouping contiguous columns of the same dtype.
+        '''
+        post: tp.List[tp.Tuple[TDtypeAny, int, int]] = []
+        for col, dtype in enumerate(dtypes):
+            if post and post[-1][0] == dtype:
+                post[-1] = (dtype, post[-1][1], col + 1)
+            else:
+                post.append((dtype, col, col + 1))
+        return tuple(post)
 
-            def labels() -> tp.Iterator[tp.Tuple[tp.Any, ...]]:
-                for _ in range(count):
-                    yield tuple(next(x) for x in gens)
+    @classmethod
+    def _block_tasks(cls,
+            shape: TShapeType,
+            dtype_specs: tp.Sequence[TDtypeSpecOrSpecs],
+            shifts: tp.Sequence[int],
+            ) -> tp.Tuple[
+                    tp.Tuple[tp.Tuple[TDtypeAny, int, int], ...],
+                    tp.List[TBlockTask],
+                    ]:
+        '''Return the block layout and, for each distinct column, the block position, dtype, dtype_spec, shift, and the block columns it fills (empty for a single-column block).
+        '''
+        count_row, count_col = shape
+        count_dtype = len(dtype_specs)
+        dtypes = [SourceValues.dtype_spec_to_dtype(dts, count=count_row)
+                for dts in dtype_specs]
+        layout = cls._block_layout([dtypes[col % count_dtype] for col in range(count_col)])
+
+        tasks: tp.List[TBlockTask] = []
+        for pos, (dtype, start, stop) in enumerate(layout):
+            if stop - start == 1:
+                tasks.append((pos, dtype, dtype_specs[start % count_dtype], shifts[start], []))
+                continue
+            # columns with the same dtype_spec and shift have the same values
+            filled: tp.Dict[tp.Tuple[TDtypeSpecOrSpecs, int], tp.List[int]] = {}
+            for col in range(start, stop):
+                key = (dtype_specs[col % count_dtype], shifts[col])
+                if key not in filled:
+                    filled[key] = []
+                    tasks.append((pos, dtype, key[0], key[1], filled[key]))
+                filled[key].append(col - start)
+        return layout, tasks
 
-            return builder.from_labels(labels(), index_constructors=index_constructors) #type: ignore
+    @classmethod
+    def _iter_blocks(cls,
+            shape: TShapeType,
+            dtype_specs: tp.Sequence[TDtypeSpecOrSpecs],
+            shifts: tp.Sequence[int],
+            chunk_rows: int,
+            positions: tp.Optional[tp.Collection[int]] = None,
+            source: tp.Type[SourceValues] = SourceValues,
+            ) -> tp.Iterator[tp.List[TNDArrayAny]]:
+        '''Yield, for consecutive row slices of at most `chunk_rows` rows, the blocks (or only those at `positions`) of the TypeBlocks returned by `_build_type_blocks`.
+        '''
+        count_row, _ = shape
+        layout, tasks = cls._block_tasks(shape, dtype_specs, shifts)
+        if positions is not None:
+            layout = tuple(layout[pos] for pos in sorted(positions))
+            remap = {pos: i for i, pos in enumerate(sorted(positions))}
+            tasks = [(remap[task[0]], *task[1:]) for task in tasks if task[0] in remap]
+        takes = [source.dtype_spec_to_take(dtype_spec, count=count_row, shift=shift)
+                for _, _, dtype_spec, shift, _ in tasks]
+
+        for row_start in range(0, count_row, chunk_rows):
+            row_stop = min(row_start + chunk_rows, count_row)
+            blocks: tp.List[tp.Optional[TNDArrayAny]] = [
+                    None if stop - start == 1 else np.empty((row_stop - row_start, stop - start), dtype=dtype)
+                    for dtype, start, stop in layout]
+            for (pos, _, _, _, cols), take in zip(tasks, takes):
+                array = take(row_start, row_stop)
+                block = blocks[pos]
+                if block is None:
+                    blocks[pos] = array
+                    continue
+                for col in cols:
+                    block[:, col] = array
+            for block in blocks:
+                block.flags.writeable = False # type: ignore
+            yield blocks # type: ignore
 
-        # if constructor is IndexHierarchy, this will work, as array will be a 1D array of tuples that, when given to from_labels, will work
-        array = SourceValues.dtype_spec_to_array(dtype_spec, count=count)
-        return constructor.from_labels(array) #type: ignore
+    @classmethod
+    def _iter_type_blocks(cls,
+            shape: TShapeType,
+            dtype_specs: tp.Sequence[TDtypeSpecOrSpecs],
+            str_to_type: StrToTypeInterface,
+            shifts: tp.Sequence[int],
+            chunk_rows: int,
+            source: tp.Type[SourceValues] = SourceValues,
+            ) -> tp.Iterator['TypeBlocks']:
+        '''Yield TypeBlocks of consecutive row slices, each of at most `chunk_rows` rows, of the TypeBlocks returned by `_build_type_blocks`.
+        '''
+        for blocks in cls._iter_blocks(shape, dtype_specs, shifts, chunk_rows, source=source):
+            yield str_to_type['TB'].from_blocks(blocks)
 
-    @staticmethod
-    def _build_type_blocks(
+    @classmethod
+    def _build_type_blocks(cls,
             shape: TShapeType,
             dtype_specs: tp.Sequence[TDtypeSpecOrSpecs],
             str_to_type: StrToTypeInterface,
+            shifts: tp.Optional[tp.Sequence[int]] = None,
+            workers: int = 1,
+            arrays: tp.Optional[tp.Mapping[TColumnKey, TNDArrayAny]] = None,
+            source: tp.Type[SourceValues] = SourceValues,
             ) -> 'TypeBlocks':
-
+        '''
+        Args:
+            workers: if greater than 1, the number of threads used to create columns.
+            arrays: column arrays created in advance, by dtype_spec, count, and shift; other columns are created.
+        '''
         count_row, count_col = shape
-        count_dtype = len(dtype_specs)
+        shifts_col = cls._shifts(count_col, source) if shifts is None else shifts
+        layout, tasks = cls._block_tasks(shape, dtype_specs, shifts_col)
+        profiling = bool(profile_hooks.hooks)
+        clock = perf_counter() if profiling else 0.0
+
+        # a block is None for a single-column run, else a preallocated consolidated block
+        blocks: tp.List[tp.Optional[TNDArrayAny]] = [
+                None if stop - start == 1 else np.empty((count_row, stop - start), dtype=dtype)
+                for dtype, start, stop in layout]
+
+        def fill(
+                pos: int,
+                dtype: TDtypeAny,
+                dtype_spec: TDtypeSpecOrSpecs,
+                shift: int,
+                cols: tp.List[int],
+                ) -> None:
+            block = blocks[pos]
+            array = arrays.get((dtype_spec, count_row, shift)) if arrays else None
+            if array is None:
+                if block is None or dtype.kind == 'O':
+                    array = source.dtype_spec_to_array(
+                            dtype_spec,
+                            count=count_row,
+                            shift=shift,
+                            )
+                else: # filled into a block, this array is not retained
+                    array = source.dtype_to_array(
+                            np.dtype(dtype_spec), # type: ignore
+                            count=count_row,
+                            shift=shift,
+                            )
+            if block is None:
+                blocks[pos] = array
+                return
+            for col in cols:
+                block[:, col] = array
+
+        def fill_profile(
+                pos: int,
+                dtype: TDtypeAny,
+                dtype_spec: TDtypeSpecOrSpecs,
+                shift: int,
+                cols: tp.List[int],
+                ) -> None:
+            clock_fill = perf_counter()
+            fill(pos, dtype, dtype_spec, shift, cols)
+            # named by the position of the first column filled
+            profile_hooks.emit('column',
+                    str(layout[pos][1] + (cols[0] if cols else 0)),
+                    perf_counter() - clock_fill,
+                    count_row * dtype.itemsize,
+                    )
 
-        def gen() -> tp.Iterator[TNDArrayAny]:
-            ints = SourceValues.dtype_to_array(DTYPE_INT, count=count_col)
-            max_shift = 100
+        fill_task = fill_profile if profiling else fill
 
-            for col in range(count_col):
-                yield SourceValues.dtype_spec_to_array(
-                        dtype_specs[col % count_dtype],
-                        count=count_row,
-                        shift=ints[col] % max_shift
-                        )
-        return str_to_type['TB'].from_blocks(gen()).consolidate() #type: ignore
+        if workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            # NOTE: all growth is done here, as columns never read past the primitives for count_row; labels are created by the first thread that needs them
+            source.update_primitives(count_row)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(fill_task, *task) for task in tasks]:
+                    future.result()
+        else:
+            for task in tasks:
+                fill_task(*task)
+
+        for block in blocks:
+            block.flags.writeable = False # type: ignore
+
+        if profiling:
+            clock = profile_hooks.lap('values', clock, sum(b.nbytes for b in blocks)) # type: ignore
+        tb = str_to_type['TB'].from_blocks(blocks)
+        if profiling:
+            profile_hooks.lap('type_blocks', clock, tb.nbytes)
+        return tb #type: ignore
 
     #---------------------------------------------------------------------------
     @staticmethod
@@ -704,91 +1937,1139 @@ class Fixture:
         return tuple(gen())
 
     @classmethod
-    def _to_containers(cls,
-            constructors: TStrConstructorsType,
-            str_to_type: StrToTypeInterface,
-            ) -> tp.Tuple['TypeBlocks',
-                    tp.Optional[TIndexTypes],
-                    tp.Optional[TIndexTypes],
-                    ]:
+    def _parse(cls,
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = None,
+            workers: int = 1,
+            seed: tp.Optional[int] = None,
+            ) -> 'Frame':
+        return FixturePlan.from_dsl(dsl, module_sf, seed).execute(workers=workers)
+
+    @staticmethod
+    def _parse_key(
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = None,
+            seed: tp.Optional[int] = None,
+            ) -> TParseKey:
+        '''Return the `parse_cache` key of a DSL string. The key is derived from the validated components, such that invalid strings raise and strings that differ only in whitespace between tokens share a key.
+        '''
+        constructors = Grammar.dsl_to_str_constructors(dsl)
+        return (tuple(sorted(constructors.items())), module_sf, SEED if seed is None else seed)
+
+    @tp.overload
+    @classmethod
+    def parse(cls,
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = ...,
+            workers: int = ...,
+            lazy: tp.Literal[False] = ...,
+            seed: tp.Optional[int] = ...,
+            ) -> 'Frame': ...
+
+    @tp.overload
+    @classmethod
+    def parse(cls,
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = ...,
+            workers: int = ...,
+            *,
+            lazy: tp.Literal[True],
+            seed: tp.Optional[int] = ...,
+            ) -> 'LazyFrame': ...
+
+    @classmethod
+    def parse(cls,
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = None,
+            workers: int = 1,
+            lazy: bool = False,
+            seed: tp.Optional[int] = None,
+            ) -> tp.Union['Frame', 'LazyFrame']:
+        '''
+        Given a FrameFixtures DSL string, return a Frame. If the `parse_cache` is enabled, a previously created immutable Frame may be returned; grow-only Frames are always returned as new copies.
+
+        Args:
+            workers: if greater than 1, the number of threads used to create columns; the Frame is identical to that created with one worker.
+            lazy: if True, return a LazyFrame that creates columns only when selected.
+            seed: if given, values are taken from the independent primitives of this seed.
+        '''
+        if lazy:
+            return LazyFrame.from_dsl(dsl, module_sf, seed)
+        if not parse_cache.max_nbytes:
+            return cls._parse(dsl, module_sf, workers, seed)
+
+        key = cls._parse_key(dsl, module_sf, seed)
+        f: tp.Optional['Frame'] = parse_cache.get(key)
+        if profile_hooks.hooks:
+            profile_hooks.emit('cache', 'parse_cache.miss' if f is None else 'parse_cache.hit')
+        if f is None:
+            f = cls._parse(dsl, module_sf, workers, seed)
+            parse_cache.set(key, f, f.nbytes)
+
+        if f.STATIC:
+            return f
+        return f.to_frame_go() # copies mutable columns, shares immutable arrays
+
+    @staticmethod
+    def _shared_arrays(
+            plans: tp.Iterable['FixturePlan'],
+            workers: int = 1,
+            source: tp.Type[SourceValues] = SourceValues,
+            ) -> tp.Dict[TColumnKey, TNDArrayAny]:
+        '''Return the arrays of columns, by dtype_spec, count, and shift, needed by more than one plan, creating each once. All plans must take values from `source`.
+        '''
+        counts: tp.Dict[TColumnKey, int] = {}
+        for plan in plans:
+            _, tasks = Fixture._block_tasks(plan.shape, plan.dtype_specs, plan.shifts())
+            for key in dict.fromkeys((task[2], plan.shape[0], task[3]) for task in tasks):
+                counts[key] = counts.get(key, 0) + 1
+        keys = [key for key, count in counts.items() if count > 1]
+
+        def create(key: TColumnKey) -> TNDArrayAny:
+            return source.dtype_spec_to_array(key[0], count=key[1], shift=key[2])
+
+        if workers > 1 and len(keys) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(keys, executor.map(create, keys)))
+        return {key: create(key) for key in keys}
+
+    @classmethod
+    def parse_many(cls,
+            dsls: tp.Iterable[str],
+            module_sf: tp.Optional[ModuleType] = None,
+            workers: int = 1,
+            seed: tp.Optional[int] = None,
+            ) -> tp.List['Frame']:
+        '''
+        Given FrameFixtures DSL strings, return a Frame for each, in order. All strings are parsed before any Frame is created: primitives are grown as by `parse`, for the largest counts of columns and then of rows, and columns needed by more than one Frame are created once. Strings with the same components (differing only in whitespace between tokens) are created once. If the `parse_cache` is enabled, it is used as by `parse`.
+
+        Args:
+            workers: if greater than 1, the number of threads used to create columns; Frames are identical to those created by `parse` after growth for the largest count.
+            seed: if given, values are taken from the independent primitives of this seed.
+        '''
+        source = SourceValues.from_seed(seed)
+        # each string is parsed, raising if invalid, and strings with the same components share a key
+        dsl_keys = [(dsl, cls._parse_key(dsl, module_sf, seed)) for dsl in dsls]
+        frames: tp.Dict[TParseKey, 'Frame'] = {}
+        plans: tp.Dict[TParseKey, FixturePlan] = {}
+        for dsl, key in dsl_keys:
+            if key in frames or key in plans:
+                continue
+            if parse_cache.max_nbytes:
+                f: tp.Optional['Frame'] = parse_cache.get(key)
+                if profile_hooks.hooks:
+                    profile_hooks.emit('cache', 'parse_cache.miss' if f is None else 'parse_cache.hit')
+                if f is not None:
+                    frames[key] = f
+                    continue
+            plans[key] = FixturePlan.from_dsl(dsl, module_sf, seed)
+
+        if plans:
+            # NOTE: grown as by parse, first for the shifts of the largest count of columns, then for the largest count of rows; no later growth is needed, as no Frame reads past the primitives for its largest count
+            source.update_primitives(max(plan.shape[1] for plan in plans.values()))
+            source.update_primitives(max(plan.shape[0] for plan in plans.values()))
+            arrays = cls._shared_arrays(plans.values(), workers, source)
+            for key, plan in plans.items():
+                f = plan.execute(workers=workers, arrays=arrays)
+                if parse_cache.max_nbytes:
+                    parse_cache.set(key, f, f.nbytes)
+                frames[key] = f
+
+        # a Frame returned more than once, or from the cache, is copied if grow-only
+        returned: tp.Set[TParseKey] = set()
+        post = []
+        for _, key in dsl_keys:
+            f = frames[key]
+            if f.STATIC or (key not in returned and not parse_cache.max_nbytes):
+                post.append(f)
+            else:
+                post.append(f.to_frame_go()) # copies mutable columns, shares immutable arrays
+            returned.add(key)
+        return post
+
+    @classmethod
+    def iter_parse(cls,
+            dsl: str,
+            chunk_rows: int,
+            module_sf: tp.Optional[ModuleType] = None,
+            seed: tp.Optional[int] = None,
+            ) -> tp.Iterator['Frame']:
+        '''
+        Given a FrameFixtures DSL string, yield Frames of consecutive row slices, each of at most `chunk_rows` rows, of the Frame returned by `parse`.
+        '''
+        return FixturePlan.from_dsl(dsl, module_sf, seed).iter_execute(chunk_rows)
+
+    @classmethod
+    def write(cls,
+            dsl: str,
+            fp: TPathSpecifier,
+            format: str = 'npz',
+            chunk_rows: int = CHUNK_ROWS,
+            module_sf: tp.Optional[ModuleType] = None,
+            seed: tp.Optional[int] = None,
+            ) -> None:
+        '''
+        Given a FrameFixtures DSL string, write the Frame returned by `parse` to a file without creating the full Frame. `format` is one of "npz", "parquet", or "arrow".
+        '''
+        FixturePlan.from_dsl(dsl, module_sf, seed).write(fp, format=format, chunk_rows=chunk_rows)
 
-        shape: TShapeType = tp.cast(TShapeType, constructors['s'])
+
+class FixturePlan:
+    '''
+    A FrameFixtures DSL string resolved to constructors and dtype specifiers. A plan can be executed many times, optionally with a different shape, without parsing the DSL or resolving specifiers again.
+    '''
+    __slots__ = (
+            'shape',
+            'builder',
+            'dtype_specs',
+            'index_spec',
+            'columns_spec',
+            'source',
+            '_str_to_type',
+            '_shifts',
+            )
+
+    @classmethod
+    def from_dsl(cls,
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = None,
+            seed: tp.Optional[int] = None,
+            ) -> 'FixturePlan':
+        '''
+        Args:
+            seed: if given, values are taken from the independent primitives of this seed.
+        '''
+        source = SourceValues.from_seed(seed)
+        str_to_type = StrToTypeInterface.from_module(module_sf)
+        clock = perf_counter() if profile_hooks.hooks else 0.0
+        constructors = Grammar.dsl_to_str_constructors(dsl)
+        if profile_hooks.hooks:
+            profile_hooks.lap('dsl', clock)
+
+        def index_spec(key: str) -> tp.Optional[TBuildType]:
+            # must be two args
+            if key in constructors and constructors[key]:
+                return Fixture._str_to_build(constructors[key], str_to_type)
+            return None
+
+        if Grammar.FRAME in constructors and constructors[Grammar.FRAME]:
+            builder = Fixture._str_to_build(constructors[Grammar.FRAME], str_to_type)[0]
+        else:
+            builder = str_to_type['F']
 
         if Grammar.VALUES not in constructors:
-            values_constructor = ('float',)
+            values_constructor: TStrConstructorType = ('float',)
         else:
-            values_constructor = constructors['v'] #type: ignore
-        tb = cls._build_type_blocks(
-                shape,
-                cls._str_to_build(values_constructor, str_to_type),
-                str_to_type,
+            values_constructor = constructors[Grammar.VALUES]
+
+        return cls(
+                shape=tp.cast(TShapeType, constructors[Grammar.SHAPE]),
+                builder=builder,
+                dtype_specs=Fixture._str_to_build(values_constructor, str_to_type),
+                index_spec=index_spec(Grammar.INDEX),
+                columns_spec=index_spec(Grammar.COLUMNS),
+                str_to_type=str_to_type,
+                source=source,
+                )
+
+    def __init__(self,
+            shape: TShapeType,
+            builder: TBuildArg,
+            dtype_specs: TBuildType,
+            index_spec: tp.Optional[TBuildType],
+            columns_spec: tp.Optional[TBuildType],
+            str_to_type: StrToTypeInterface,
+            shifts: tp.Optional[tp.Dict[int, tp.List[int]]] = None,
+            source: tp.Type[SourceValues] = SourceValues,
+            ):
+        self.shape = shape
+        self.builder = builder
+        self.dtype_specs = dtype_specs
+        self.index_spec = index_spec
+        self.columns_spec = columns_spec
+        self.source = source # the store of primitives from which values are taken
+        self._str_to_type = str_to_type
+        # column shifts by column count, shared with plans of other shapes
+        self._shifts: tp.Dict[int, tp.List[int]] = {} if shifts is None else shifts
+
+    def __repr__(self) -> str:
+        if self.source is SourceValues:
+            return f'<{self.__class__.__name__}: shape={self.shape}>'
+        return f'<{self.__class__.__name__}: shape={self.shape} seed={self.source._SEED}>' #pylint: disable=W0212
+
+    def with_shape(self, shape: TShapeType) -> 'FixturePlan':
+        '''Return a plan with the same components but a different shape.
+        '''
+        return self.__class__(
+                shape=shape,
+                builder=self.builder,
+                dtype_specs=self.dtype_specs,
+                index_spec=self.index_spec,
+                columns_spec=self.columns_spec,
+                str_to_type=self._str_to_type,
+                shifts=self._shifts,
+                source=self.source,
                 )
 
-        # must be two args
-        if 'i' in constructors and constructors['i']:
-            constructor, dtype_spec = cls._str_to_build(
-                    constructors['i'],
+    #---------------------------------------------------------------------------
+    def shifts(self) -> tp.List[int]:
+        '''Return the shift applied to the values of each column. As this can grow primitives, it is only called on execution.
+        '''
+        count_col = self.shape[1]
+        if count_col not in self._shifts:
+            self._shifts[count_col] = Fixture._shifts(count_col, self.source)
+        return self._shifts[count_col]
+
+    @property
+    def dtypes(self) -> tp.Tuple[TDtypeAny, ...]:
+        '''The dtype of each column, known without executing the plan.
+        '''
+        count_row, count_col = self.shape
+        dtypes = [SourceValues.dtype_spec_to_dtype(spec, count=count_row)
+                for spec in self.dtype_specs]
+        return tuple(dtypes[col % len(dtypes)] for col in range(count_col))
+
+    @property
+    def block_layout(self) -> tp.Tuple[tp.Tuple[TDtypeAny, int, int], ...]:
+        '''The dtype, start column, and stop column of each consolidated block, known without executing the plan.
+        '''
+        return Fixture._block_layout(self.dtypes)
+
+    @property
+    def nbytes(self) -> int:
+        '''The bytes of the values, excluding index and columns, known without executing the plan.
+        '''
+        return sum(dtype.itemsize for dtype in self.dtypes) * self.shape[0]
+
+    #---------------------------------------------------------------------------
+    def execute(self,
+            shape: tp.Optional[TShapeType] = None,
+            workers: int = 1,
+            arrays: tp.Optional[tp.Mapping[TColumnKey, TNDArrayAny]] = None,
+            ) -> 'Frame':
+        '''Return a Frame from this plan, optionally with a different shape. If `workers` is greater than 1, columns are created with that many threads. Columns found in `arrays`, by dtype_spec, count, and shift, are not created.
+        '''
+        if shape is not None and tuple(shape) != tuple(self.shape):
+            return self.with_shape(shape).execute(workers=workers, arrays=arrays)
+
+        str_to_type = self._str_to_type
+        count_row, count_col = self.shape
+        profiling = bool(profile_hooks.hooks)
+        clock = perf_counter() if profiling else 0.0
+
+        shifts = self.shifts()
+        if profiling:
+            profile_hooks.lap('shifts', clock)
+        tb = Fixture._build_type_blocks(
+                self.shape,
+                self.dtype_specs,
+                str_to_type,
+                shifts=shifts,
+                workers=workers,
+                arrays=arrays,
+                source=self.source,
+                )
+        if profiling:
+            clock = perf_counter()
+        index = None
+        if self.index_spec:
+            index = Fixture._build_index(
+                    count_row,
+                    self.index_spec[0], # type: ignore
+                    self.index_spec[1],
                     str_to_type,
+                    source=self.source,
                     )
-            index = cls._build_index(
-                    shape[0],
-                    constructor, # type: ignore
-                    dtype_spec,
+            if profiling:
+                clock = profile_hooks.lap('index', clock, index.nbytes)
+        columns = None
+        if self.columns_spec:
+            columns = Fixture._build_index(
+                    count_col,
+                    self.columns_spec[0], # type: ignore
+                    self.columns_spec[1],
                     str_to_type,
+                    source=self.source,
                     )
-        else:
-            index = None
+            if profiling:
+                clock = profile_hooks.lap('columns', clock, columns.nbytes)
 
-        if 'c' in constructors and constructors['c']:
-            constructor, dtype_spec = cls._str_to_build(
-                    constructors['c'],
+        f: 'Frame' = self.builder(tb, #type: ignore
+                index=index,
+                columns=columns,
+                own_index=index is not None,
+                own_columns=columns is not None,
+                own_data=True,
+                )
+        if profiling:
+            profile_hooks.lap('frame', clock, f.nbytes)
+        return f
+
+
+    def iter_execute(self,
+            chunk_rows: int,
+            shape: tp.Optional[TShapeType] = None,
+            ) -> tp.Iterator['Frame']:
+        '''Yield Frames of consecutive row slices, each of at most `chunk_rows` rows, equal to slices of the Frame returned by `execute()`. Beyond primitives, only the columns and one chunk of values and index are in memory.
+        '''
+        if shape is not None and tuple(shape) != tuple(self.shape):
+            yield from self.with_shape(shape).iter_execute(chunk_rows)
+            return
+        if chunk_rows <= 0:
+            raise ValueError(f'chunk_rows {chunk_rows} is <= 0')
+
+        str_to_type = self._str_to_type
+        count_row, count_col = self.shape
+        shifts = self.shifts()
+        # NOTE: grow for all rows before creating columns to match growth done by execute()
+        self.source.update_primitives(count_row)
+
+        columns = None
+        if self.columns_spec:
+            columns = Fixture._build_index(
+                    count_col,
+                    self.columns_spec[0], # type: ignore
+                    self.columns_spec[1],
                     str_to_type,
+                    source=self.source,
                     )
-            columns = cls._build_index(
-                    shape[1],
-                    constructor, # type: ignore
-                    dtype_spec,
+        indices = None
+        if self.index_spec:
+            indices = Fixture._iter_index(
+                    count_row,
+                    chunk_rows,
+                    self.index_spec[0], # type: ignore
+                    self.index_spec[1],
                     str_to_type,
+                    source=self.source,
                     )
+        tbs = Fixture._iter_type_blocks(
+                self.shape,
+                self.dtype_specs,
+                str_to_type,
+                shifts,
+                chunk_rows,
+                source=self.source,
+                )
+        for start, tb in zip(range(0, count_row, chunk_rows), tbs):
+            if indices is None:
+                index: tp.Any = np.arange(start, start + tb.shape[0])
+            else:
+                index = next(indices)
+            yield self.builder(tb, #type: ignore
+                    index=index,
+                    columns=columns,
+                    own_index=indices is not None,
+                    own_data=True,
+                    )
+
+
+    #---------------------------------------------------------------------------
+    def _iter_index_arrays(self,
+            count: int,
+            chunk_rows: int,
+            spec: TBuildType,
+            depth: int,
+            ) -> tp.Iterator[TNDArrayAny]:
+        '''Yield the labels at `depth` of each chunk of an index.
+        '''
+        for index in Fixture._iter_index(
+                count,
+                chunk_rows,
+                spec[0], # type: ignore
+                spec[1],
+                self._str_to_type,
+                source=self.source,
+                ):
+            yield index.values if index.depth == 1 else index.values_at_depth(depth)
+
+    def _write_npz(self,
+            fp: TPathSpecifier,
+            chunk_rows: int,
+            ) -> None:
+        '''Write an NPZ in the layout of `Frame.to_npz()`, writing each array in chunks of rows.
+        '''
+        import json
+        from zipfile import ZipFile
+        from zipfile import ZIP_STORED
+
+        if any(dtype.kind == 'O' for dtype in self.dtypes):
+            raise ValueError('NPZ does not support object dtypes')
+
+        str_to_type = self._str_to_type
+        count_row, count_col = self.shape
+        shifts = self.shifts()
+        # NOTE: grow for all rows before creating columns to match growth done by execute()
+        self.source.update_primitives(count_row)
+
+        metadata: tp.Dict[str, tp.Any] = {'__names__': [None, None, None]}
+        types = []
+        depths = []
+
+        def write_array(
+                archive: ZipFile,
+                name: str,
+                shape: tp.Tuple[int, ...],
+                dtype: TDtypeAny,
+                chunks: tp.Iterable[TNDArrayAny],
+                ) -> None:
+            with archive.open(name, 'w', force_zip64=True) as f:
+                np.lib.format.write_array_header_1_0(f, { # type: ignore
+                        'descr': np.lib.format.dtype_to_descr(dtype), # type: ignore
+                        'fortran_order': False,
+                        'shape': shape,
+                        })
+                for chunk in chunks:
+                    if chunk.dtype != dtype:
+                        raise RuntimeError(f'chunk dtype {chunk.dtype} does not match {dtype}')
+                    f.write(chunk.tobytes())
+
+        with ZipFile(fp, mode='w', compression=ZIP_STORED, allowZip64=True) as archive:
+            for key, spec, count in (
+                    ('index', self.index_spec, count_row),
+                    ('columns', self.columns_spec, count_col),
+                    ):
+                if not spec: # an auto index stores no labels
+                    types.append('Index' if key == 'index'
+                            else self.builder._COLUMNS_CONSTRUCTOR.__name__) # type: ignore
+                    depths.append(1)
+                    continue
+                # NOTE: the columns are small and created once
+                chunk_count = chunk_rows if key == 'index' else max(count, 1)
+                index = next(iter(Fixture._iter_index(
+                        count,
+                        chunk_count,
+                        spec[0], # type: ignore
+                        spec[1],
+                        str_to_type,
+                        source=self.source,
+                        )), None)
+                if index is None: # no labels
+                    index = Fixture._build_index(count, spec[0], spec[1], str_to_type, source=self.source) # type: ignore
+                types.append(index.__class__.__name__)
+                depths.append(index.depth)
+                if index.depth > 1:
+                    metadata[f'__types_{key}__'] = [
+                            cls.__name__ for cls in index.index_types.values]
+                for depth in range(index.depth):
+                    dtype = index.dtypes.values[depth] if index.depth > 1 else index.dtype # type: ignore
+                    if dtype.kind == 'O':
+                        raise ValueError('NPZ does not support object dtypes')
+                    write_array(archive,
+                            f'__values_{key}_{depth}__.npy',
+                            (count,),
+                            dtype,
+                            self._iter_index_arrays(count, chunk_count, spec, depth),
+                            )
+
+            layout, _ = Fixture._block_tasks(self.shape, self.dtype_specs, shifts)
+            if not layout: # raise as execute() would
+                str_to_type['TB'].from_blocks(())
+            for pos, (dtype, start, stop) in enumerate(layout):
+                write_array(archive,
+                        f'__blocks_{pos}__.npy',
+                        (count_row,) if stop - start == 1 else (count_row, stop - start),
+                        dtype,
+                        (blocks[0] for blocks in Fixture._iter_blocks(
+                                self.shape,
+                                self.dtype_specs,
+                                shifts,
+                                chunk_rows,
+                                positions=(pos,),
+                                source=self.source,
+                                )),
+                        )
+
+            metadata['__types__'] = types
+            metadata['__depths__'] = [len(layout), *depths]
+            archive.writestr('__meta__.json', json.dumps(metadata))
+
+    def _write_arrow(self,
+            fp: TPathSpecifier,
+            chunk_rows: int,
+            format: str,
+            ) -> None:
+        '''Write Parquet or Arrow IPC as `Frame.to_arrow()` would, writing each chunk of rows as a row group or record batch.
+        '''
+        import pyarrow
+
+        writer = None
+        try:
+            for f in self.iter_execute(chunk_rows):
+                table = f.to_arrow()
+                if writer is None:
+                    if format == 'parquet':
+                        import pyarrow.parquet
+                        writer = pyarrow.parquet.ParquetWriter(fp, table.schema)
+                    else:
+                        writer = pyarrow.ipc.new_file(fp, table.schema)
+                writer.write_table(table)
+            if writer is None: # no rows
+                table = self.execute().to_arrow()
+                if format == 'parquet':
+                    import pyarrow.parquet
+                    pyarrow.parquet.write_table(table, fp)
+                else:
+                    with pyarrow.ipc.new_file(fp, table.schema) as empty:
+                        empty.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def write(self,
+            fp: TPathSpecifier,
+            format: str = 'npz',
+            chunk_rows: int = CHUNK_ROWS,
+            ) -> None:
+        '''Write the Frame of this plan to a file, creating at most `chunk_rows` rows at a time. `format` is one of "npz" (as written by `Frame.to_npz()`), "parquet" (as written by `Frame.to_parquet()`), or "arrow" (an Arrow IPC file of `Frame.to_arrow()`).
+        '''
+        if format not in WRITE_FORMATS:
+            raise ValueError(f'{format!r} is not a valid format. Choose one of {", ".join(WRITE_FORMATS)}')
+        if chunk_rows <= 0:
+            raise ValueError(f'chunk_rows {chunk_rows} is <= 0')
+        if format == 'npz':
+            self._write_npz(fp, chunk_rows)
         else:
-            columns = None
+            self._write_arrow(fp, chunk_rows, format)
+
 
-        return tb, index, columns
+#-------------------------------------------------------------------------------
+class LazyFrame:
+    '''
+    A Frame from a FixturePlan that exposes shape, dtypes, index, and columns immediately, but creates the values of a column only when it is selected. Any other attribute is taken from the Frame created, once, by `to_frame()`.
+    '''
+    __slots__ = (
+            '_plan',
+            '_shifts',
+            '_index',
+            '_columns',
+            '_arrays',
+            '_frame',
+            )
 
     @classmethod
-    def parse(cls,
+    def from_dsl(cls,
             dsl: str,
             module_sf: tp.Optional[ModuleType] = None,
-            ) -> 'Frame':
+            seed: tp.Optional[int] = None,
+            ) -> 'LazyFrame':
+        return cls(FixturePlan.from_dsl(dsl, module_sf, seed))
+
+    def __init__(self, plan: FixturePlan):
+        self._plan = plan
+        # NOTE: grow for all rows on creation to match growth done by execute(); no column then grows primitives
+        self._shifts = plan.shifts()
+        plan.source.update_primitives(plan.shape[0])
+
+        self._index: tp.Optional[TIndexTypes] = None
+        self._columns: tp.Optional[TIndexTypes] = None
+        self._arrays: tp.Dict[int, TNDArrayAny] = {}
+        self._frame: tp.Optional['Frame'] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: shape={self.shape}>'
+
+    def __getattr__(self, name: str) -> tp.Any:
+        if name.startswith('_'): # never force a Frame for private or special attributes
+            raise AttributeError(name)
+        return getattr(self.to_frame(), name)
+
+    def __len__(self) -> int:
+        return self.shape[0]
 
-        str_to_type = StrToTypeInterface(
-                module_sf=module_sf,
+    #---------------------------------------------------------------------------
+    def _build_index(self,
+            count: int,
+            spec: tp.Optional[TBuildType],
+            static: bool,
+            ) -> TIndexTypes:
+        str_to_type = self._plan._str_to_type
+        if spec:
+            return Fixture._build_index(
+                    count,
+                    spec[0], # type: ignore
+                    spec[1],
+                    str_to_type,
+                    source=self._plan.source,
+                    )
+        # as created by a Frame given no labels
+        constructor = str_to_type['I'] if static else str_to_type['Ig']
+        return constructor(np.arange(count), loc_is_iloc=True) # type: ignore
+
+    @property
+    def shape(self) -> TShapeType:
+        return tuple(self._plan.shape) # type: ignore
+
+    @property
+    def index(self) -> TIndexTypes:
+        if self._frame is not None:
+            return self._frame.index # type: ignore
+        if self._index is None:
+            self._index = self._build_index(self.shape[0], self._plan.index_spec, True)
+        return self._index
+
+    @property
+    def columns(self) -> TIndexTypes:
+        if self._frame is not None:
+            return self._frame.columns # type: ignore
+        if self._columns is None:
+            self._columns = self._build_index(
+                    self.shape[1],
+                    self._plan.columns_spec,
+                    self._plan.builder.STATIC, # type: ignore
+                    )
+        return self._columns
+
+    @property
+    def dtypes(self) -> tp.Any:
+        '''Return a Series of the dtype of each column, known without creating any column.
+        '''
+        Series = self._plan._str_to_type.module_sf.Series
+        return Series(self._plan.dtypes, index=self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        return self._plan.nbytes
+
+    @property
+    def materialized(self) -> tp.Tuple[int, ...]:
+        '''The positions of columns created so far.
+        '''
+        return tuple(sorted(self._arrays))
+
+    #---------------------------------------------------------------------------
+    def _array(self, col: int) -> TNDArrayAny:
+        '''Return the values of the column at `col`, created on first selection.
+        '''
+        array = self._arrays.get(col)
+        if array is None:
+            dtype_specs = self._plan.dtype_specs
+            array = self._plan.source.dtype_spec_to_array(
+                    dtype_specs[col % len(dtype_specs)],
+                    count=self.shape[0],
+                    shift=self._shifts[col],
+                    )
+            self._arrays[col] = array
+        return array
+
+    def __getitem__(self, key: tp.Any) -> tp.Any:
+        '''Select columns by label as from the Frame, creating only the selected columns.
+        '''
+        if self._frame is not None:
+            return self._frame[key]
+
+        columns = self.columns
+        iloc_key = columns.loc_to_iloc(key)
+        positions = np.atleast_1d(np.arange(len(columns))[iloc_key])
+
+        str_to_type = self._plan._str_to_type
+        tb = str_to_type['TB'].from_blocks(
+                [self._array(col) for col in positions.tolist()]
+                if len(positions) else np.empty((self.shape[0], 0)))
+        f: 'Frame' = self._plan.builder(tb, # type: ignore
+                index=self.index,
+                columns=columns.iloc[positions],
+                own_data=True,
                 )
-        constructors = Grammar.dsl_to_str_constructors(dsl)
+        if isinstance(iloc_key, (int, np.integer)):
+            return f.iloc[:, 0]
+        return f
 
-        tb, index, columns = cls._to_containers(constructors, str_to_type)
+    def to_frame(self) -> 'Frame':
+        '''Return the Frame, created once, with all columns.
+        '''
+        if self._frame is None:
+            self._frame = self._plan.execute()
+            self._index = None
+            self._columns = None
+            self._arrays.clear()
+        return self._frame
+
+
+#-------------------------------------------------------------------------------
+class SharedArray(tp.NamedTuple):
+    '''An array in a shared memory segment; object arrays are stored pickled.
+    '''
+    name: str
+    dtype: str
+    shape: tp.Tuple[int, ...]
+    nbytes: int
+
+class SharedIndex(tp.NamedTuple):
+    cls: tp.Type[tp.Any]
+    arrays: tp.Tuple[SharedArray, ...] # one per depth
+    index_types: tp.Optional[tp.Tuple[tp.Type[tp.Any], ...]]
+
+class SharedFixtureDescriptor(tp.NamedTuple):
+    '''A picklable description of a Frame in shared memory segments, sufficient to attach from any process.
+    '''
+    builder: tp.Type[tp.Any]
+    type_blocks: tp.Type[tp.Any]
+    blocks: tp.Tuple[SharedArray, ...]
+    shared_index: tp.Optional[SharedIndex]
+    shared_columns: tp.Optional[SharedIndex]
+
+
+class NaNPickler(pickle.Pickler):
+    '''Object values of fixtures use the `np.nan` singleton; pickle it by reference so that tuples including it still compare equal after unpickling.
+    '''
+    def persistent_id(self, obj: tp.Any) -> tp.Optional[str]:
+        return 'nan' if obj is np.nan else None
+
+class NaNUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: tp.Any) -> tp.Any:
+        if pid == 'nan':
+            return np.nan
+        raise pickle.UnpicklingError(f'unsupported persistent id {pid!r}')
 
-        if 'f' in constructors and constructors['f']:
-            builder = cls._str_to_build(constructors['f'], str_to_type)[0]
+
+class SharedFixture:
+    '''
+    A fixture created once into shared memory segments, one per consolidated block and per index depth. The `descriptor` can be sent to other processes and given to `attach` to create a Frame that uses the segments without copying. Segments are unlinked when the owner calls `release`; other processes call `detach` to close their mappings.
+    '''
+    __slots__ = (
+            'descriptor',
+            '_segments',
+            )
+
+    # segments by name, created or attached in this process; Frames from `attach` use their buffers
+    _ATTACHED: tp.Dict[str, shared_memory.SharedMemory] = {}
+    # counts of live arrays from `attach` by segment name; a segment is closed only when no array uses its mapping
+    _ARRAYS: tp.Dict[str, int] = {}
+    # segments released or detached while arrays still use them, closed when the last array is collected
+    _CLOSING: tp.Dict[str, tp.List[shared_memory.SharedMemory]] = {}
+    # NOTE: reentrant, as arrays may be collected, and segments closed, while the lock is held
+    _LOCK = threading.RLock()
+
+    @classmethod
+    def from_dsl(cls,
+            dsl: str,
+            module_sf: tp.Optional[ModuleType] = None,
+            chunk_rows: int = CHUNK_ROWS,
+            seed: tp.Optional[int] = None,
+            ) -> 'SharedFixture':
+        return cls.from_plan(FixturePlan.from_dsl(dsl, module_sf, seed), chunk_rows=chunk_rows)
+
+    @classmethod
+    def from_plan(cls,
+            plan: FixturePlan,
+            chunk_rows: int = CHUNK_ROWS,
+            ) -> 'SharedFixture':
+        '''Create the Frame of `plan` into shared memory, creating non-object blocks `chunk_rows` rows at a time directly into their segments.
+        '''
+        from multiprocessing import shared_memory
+
+        segments: tp.List[shared_memory.SharedMemory] = []
+
+        def create(nbytes: int) -> tp.Tuple[shared_memory.SharedMemory, str]:
+            # a segment cannot have zero size
+            shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            segments.append(shm)
+            return shm, shm.name
+
+        def share(array: TNDArrayAny) -> SharedArray:
+            if array.dtype.kind == 'O':
+                f = io.BytesIO()
+                NaNPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(array)
+                data = f.getbuffer()
+                shm, name = create(len(data))
+                shm.buf[:len(data)] = data
+                return SharedArray(name, array.dtype.str, array.shape, len(data))
+            shm, name = create(array.nbytes)
+            target: TNDArrayAny = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            target[:] = array
+            return SharedArray(name, array.dtype.str, array.shape, array.nbytes)
+
+        def share_index(index: tp.Optional[TIndexTypes]) -> tp.Optional[SharedIndex]:
+            if index is None:
+                return None
+            if index.depth == 1:
+                return SharedIndex(index.__class__, (share(index.values),), None)
+            return SharedIndex(index.__class__,
+                    tuple(share(index.values_at_depth(d)) for d in range(index.depth)),
+                    tuple(index.index_types.values),
+                    )
+
+        str_to_type = plan._str_to_type
+        count_row, count_col = plan.shape
+        try:
+            shifts = plan.shifts()
+            # NOTE: grow for all rows before creating columns to match growth done by execute()
+            plan.source.update_primitives(count_row)
+
+            layout, _ = Fixture._block_tasks(plan.shape, plan.dtype_specs, shifts)
+            if not layout: # raise as execute() would
+                str_to_type['TB'].from_blocks(())
+            blocks = []
+            for pos, (dtype, start, stop) in enumerate(layout):
+                chunks = (b[0] for b in Fixture._iter_blocks(
+                        plan.shape,
+                        plan.dtype_specs,
+                        shifts,
+                        chunk_rows,
+                        positions=(pos,),
+                        source=plan.source,
+                        ))
+                shape = (count_row,) if stop - start == 1 else (count_row, stop - start)
+                if dtype.kind == 'O':
+                    blocks.append(share(np.concatenate(list(chunks)) if count_row
+                            else np.empty(shape, dtype=dtype)))
+                    continue
+                shm, name = create(dtype.itemsize * count_row * (stop - start))
+                target: TNDArrayAny = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                row = 0
+                for chunk in chunks:
+                    target[row: row + len(chunk)] = chunk
+                    row += len(chunk)
+                blocks.append(SharedArray(name, dtype.str, shape, target.nbytes))
+
+            index = None
+            if plan.index_spec:
+                index = Fixture._build_index(count_row,
+                        plan.index_spec[0], # type: ignore
+                        plan.index_spec[1],
+                        str_to_type,
+                        source=plan.source,
+                        )
+            columns = None
+            if plan.columns_spec:
+                columns = Fixture._build_index(count_col,
+                        plan.columns_spec[0], # type: ignore
+                        plan.columns_spec[1],
+                        str_to_type,
+                        source=plan.source,
+                        )
+            descriptor = SharedFixtureDescriptor(
+                    plan.builder, # type: ignore
+                    str_to_type['TB'],
+                    tuple(blocks),
+                    share_index(index),
+                    share_index(columns),
+                    )
+        except BaseException:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+            raise
+
+        with cls._LOCK:
+            for shm in segments:
+                cls._ATTACHED[shm.name] = shm
+        return cls(descriptor, segments)
+
+    def __init__(self,
+            descriptor: SharedFixtureDescriptor,
+            segments: tp.Sequence[shared_memory.SharedMemory],
+            ):
+        self.descriptor = descriptor
+        self._segments = list(segments)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: segments={len(self._segments)}>'
+
+    def __enter__(self) -> 'SharedFixture':
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        self.release()
+
+    def release(self) -> None:
+        '''Unlink all segments. Frames already attached remain valid: the mappings they use are closed when they are garbage collected.
+        '''
+        with self._LOCK:
+            for shm in self._segments:
+                self._close(shm.name)
+                shm.unlink()
+            self._segments.clear()
+
+    #---------------------------------------------------------------------------
+    @classmethod
+    def _close(cls, name: str) -> None:
+        '''Stop attaching the segment `name`, closing its mapping now if no array from `attach` uses it, or else when the last such array is collected.
+        '''
+        with cls._LOCK:
+            shm = cls._ATTACHED.pop(name, None)
+            if shm is None: # not mapped, or already closed
+                return
+            if cls._ARRAYS.get(name):
+                cls._CLOSING.setdefault(name, []).append(shm)
+            else:
+                shm.close()
+
+    @classmethod
+    def _array_collected(cls, name: str) -> None:
+        with cls._LOCK:
+            cls._ARRAYS[name] -= 1
+            if cls._ARRAYS[name]:
+                return
+            del cls._ARRAYS[name]
+            closing = cls._CLOSING.pop(name, ())
+        for shm in closing:
+            shm.close()
+
+    @classmethod
+    def detach(cls, descriptor: SharedFixtureDescriptor) -> None:
+        '''Close the mappings of the segments of `descriptor` in this process; Frames already attached remain valid, and the mappings they use are closed when they are garbage collected. A later `attach` maps the segments again, if not yet released.
+        '''
+        shared = list(descriptor.blocks)
+        for index in (descriptor.shared_index, descriptor.shared_columns):
+            if index is not None:
+                shared.extend(index.arrays)
+        with cls._LOCK:
+            for name in dict.fromkeys(s.name for s in shared):
+                cls._close(name)
+
+    #---------------------------------------------------------------------------
+    @classmethod
+    def _segment(cls, name: str) -> shared_memory.SharedMemory:
+        from multiprocessing import shared_memory
+        from multiprocessing import resource_tracker
+        from multiprocessing import parent_process
+
+        with cls._LOCK:
+            if name not in cls._ATTACHED:
+                try:
+                    shm = shared_memory.SharedMemory(name=name, track=False) # type: ignore #pylint: disable=E1123
+                except TypeError:
+                    # before Python 3.13, attaching registers the segment with the resource tracker, which unlinks it at exit; multiprocessing children share the tracker of their parent, where the owner has already registered it
+                    shm = shared_memory.SharedMemory(name=name)
+                    if os.name == 'posix' and parent_process() is None:
+                        resource_tracker.unregister(shm._name, 'shared_memory') # type: ignore
+                cls._ATTACHED[name] = shm
+            return cls._ATTACHED[name]
+
+    @classmethod
+    def _array(cls, shared: SharedArray) -> TNDArrayAny:
+        shm = cls._segment(shared.name)
+        dtype = np.dtype(shared.dtype)
+        if dtype.kind == 'O':
+            array: TNDArrayAny = NaNUnpickler(io.BytesIO(shm.buf[:shared.nbytes])).load()
         else:
-            builder = str_to_type['F']
+            # NOTE: the array does not hold an export of the buffer, so the mapping is kept open until the array, and all views of it, are collected
+            array = np.ndarray(shared.shape, dtype=dtype, buffer=shm.buf)
+            with cls._LOCK:
+                cls._ARRAYS[shared.name] = cls._ARRAYS.get(shared.name, 0) + 1
+            weakref.finalize(array, cls._array_collected, shared.name)
+        array.flags.writeable = False
+        return array
 
-        return builder(tb, #type: ignore
+    @classmethod
+    def _index(cls, shared: SharedIndex) -> TIndexTypes:
+        if shared.index_types is None:
+            return shared.cls(cls._array(shared.arrays[0])) # type: ignore
+        return shared.cls.from_values_per_depth( # type: ignore
+                [cls._array(a) for a in shared.arrays],
+                index_constructors=shared.index_types,
+                )
+
+    @classmethod
+    def attach(cls, descriptor: SharedFixtureDescriptor) -> 'Frame':
+        '''Return a Frame from a descriptor; arrays (other than those of objects, which are unpickled) are immutable views of the shared memory segments.
+        '''
+        index = (None if descriptor.shared_index is None
+                else cls._index(descriptor.shared_index))
+        columns = (None if descriptor.shared_columns is None
+                else cls._index(descriptor.shared_columns))
+        blocks = [cls._array(b) for b in descriptor.blocks]
+        return descriptor.builder( # type: ignore
+                descriptor.type_blocks.from_blocks(blocks),
                 index=index,
                 columns=columns,
+                own_data=True,
                 own_index=index is not None,
                 own_columns=columns is not None,
-                own_data=True,
                 )
 
 
+def compile(dsl: str, seed: tp.Optional[int] = None) -> FixturePlan:
+    '''
+    Given a FrameFixtures DSL string, return a FixturePlan that can be executed many times. If `seed` is given, values are taken from the independent primitives of that seed.
+    '''
+    return FixturePlan.from_dsl(dsl, seed=seed)
+
+
+def iter_parse(dsl: str,
+        chunk_rows: int,
+        seed: tp.Optional[int] = None,
+        ) -> tp.Iterator['Frame']:
+    '''
+    Given a FrameFixtures DSL string, yield Frames of consecutive row slices, each of at most `chunk_rows` rows, of the Frame returned by `parse`.
+    '''
+    return Fixture.iter_parse(dsl=dsl, chunk_rows=chunk_rows, seed=seed)
+
+
+def write(dsl: str,
+        fp: TPathSpecifier,
+        format: str = 'npz',
+        chunk_rows: int = CHUNK_ROWS,
+        seed: tp.Optional[int] = None,
+        ) -> None:
+    '''
+    Given a FrameFixtures DSL string, write the Frame returned by `parse` to a file without creating the full Frame. `format` is one of "npz", "parquet", or "arrow".
+    '''
+    Fixture.write(dsl=dsl, fp=fp, format=format, chunk_rows=chunk_rows, seed=seed)
+
+
+def share(dsl: str, seed: tp.Optional[int] = None) -> SharedFixture:
+    '''
+    Given a FrameFixtures DSL string, create the Frame returned by `parse` into shared memory, returning the owning SharedFixture. Give its `descriptor` to `attach` in any process.
+    '''
+    return SharedFixture.from_dsl(dsl, seed=seed)
+
+
+def attach(descriptor: SharedFixtureDescriptor) -> 'Frame':
+    '''
+    Given the descriptor of a SharedFixture, return a Frame that uses its shared memory without copying.
+    '''
+    return SharedFixture.attach(descriptor)
+
+def detach(descriptor: SharedFixtureDescriptor) -> None:
+    '''
+    Given the descriptor of a SharedFixture, close its shared memory in this process once Frames attached from it are garbage collected.
+    '''
+    SharedFixture.detach(descriptor)
+
+def warmup(count: int = COUNT_INIT, seed: tp.Optional[int] = None) -> None:
+    '''
+    Import StaticFrame and create primitives (of `seed`, if given), including labels, for fixtures of up to `count` rows, such that the first fixture created does not incur these costs. As when creating a fixture of `count` rows, a `count` greater than the default changes the values of later fixtures.
+    '''
+    StrToTypeInterface.from_module(None)
+    SourceValues.from_seed(seed).update_labels(count)
+
+def profile(callback: tp.Optional[TProfileHook] = None) -> Profile:
+    '''
+    Return a context manager that records a ProfileEvent for each phase, column, cache lookup, and growth of primitives of Frames created while entered, optionally calling `callback` with each.
+    '''
+    return Profile(callback)
+
+
+def parse_many(dsls: tp.Iterable[str],
+        workers: int = 1,
+        seed: tp.Optional[int] = None,
+        ) -> tp.List['Frame']:
+    '''
+    Given FrameFixtures DSL strings, return a Frame for each, in order, growing primitives once and creating columns needed by more than one Frame once. If `workers` is greater than 1, columns are created with that many threads. If `seed` is given, values are taken from the independent primitives of that seed.
+    '''
+    return Fixture.parse_many(dsls=dsls, workers=workers, seed=seed)
+
+@tp.overload
+def parse(dsl: str, workers: int = ..., lazy: tp.Literal[False] = ..., seed: tp.Optional[int] = ...) -> 'Frame': ...
 
+@tp.overload
+def parse(dsl: str, workers: int = ..., *, lazy: tp.Literal[True], seed: tp.Optional[int] = ...) -> LazyFrame: ...
 
-def parse(dsl: str) -> 'Frame':
+def parse(dsl: str,
+        workers: int = 1,
+        lazy: bool = False,
+        seed: tp.Optional[int] = None,
+        ) -> tp.Union['Frame', LazyFrame]:
     '''
-    Given a FrameFixtures DSL string, return a Fraem.
+    Given a FrameFixtures DSL string, return a Fraem. If `workers` is greater than 1, columns are created with that many threads. If `lazy` is True, return a LazyFrame that creates columns only when selected. If `seed` is given, values are taken from the independent primitives of that seed, created and cached on first use; the default primitives are not changed.
     '''
-    return Fixture.parse(dsl=dsl)
+    if lazy:
+        return Fixture.parse(dsl=dsl, lazy=True, seed=seed)
+    return Fixture.parse(dsl=dsl, workers=workers, seed=seed)
 
 
 
@@ -0,0 +1,250 @@
+'''
+Benchmarks of Fixture creation, measuring time and peak memory for each case and comparing to a stored baseline. Run with `python -m frame_fixtures.performance.main`.
+'''
+from __future__ import annotations
+
+import typing as tp
+import os
+import sys
+import json
+import argparse
+import gc
+import platform
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+from frame_fixtures.core import Fixture
+from frame_fixtures.core import SourceValues
+from frame_fixtures.core import get_str_to_dtype
+from frame_fixtures.core import TPathSpecifier
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+MODES = ('cold', 'warm')
+REPEAT = 5
+THRESHOLD = 0.5 # proportional increase in time reported as a regression
+THRESHOLD_PEAK = 0.1 # proportional increase in peak memory reported as a regression
+SECONDS_SAMPLE = 0.05 # each repeat creates a Fixture as many times as needed to take at least this long, such that short cases vary as little as long ones
+PEAK_BYTES_MIN = 65_536 # increases in peak memory smaller than this are not regressions
+
+#-------------------------------------------------------------------------------
+
+class BenchCase(tp.NamedTuple):
+    name: str
+    dsl: str
+    mode: str # one of MODES
+
+class BenchResult(tp.NamedTuple):
+    name: str
+    seconds: float # minimum of repeats of the mean time to create one Frame
+    peak_bytes: int # peak memory traced while creating one Frame
+
+class BenchRegression(tp.NamedTuple):
+    name: str
+    measure: str # one of "seconds" or "peak_bytes"
+    baseline: float
+    current: float
+
+def iter_dsl() -> tp.Iterator[tp.Tuple[str, str]]:
+    '''Yield pairs of case name and DSL string.
+    '''
+    # every dtype specifier, as a column of a tall Frame
+    for name in get_str_to_dtype():
+        yield f'dtype-{name}', f's(10_000,4)|v({name})'
+
+    # IndexHierarchy of depths 2 to 4, on the index and on the columns
+    for depth, dtypes in (
+            (2, 'str,int'),
+            (3, 'str,int,dtD'),
+            (4, 'str,int,dtD,int'),
+            ):
+        yield f'index-ih{depth}', f's(10_000,4)|i(IH,({dtypes}))'
+        yield f'columns-ih{depth}', f's(4,1_000)|c(IH,({dtypes}))'
+
+    # datetime64 Index constructors
+    for constructor, dtype in (
+            ('IY', 'dtY'),
+            ('IM', 'dtM'),
+            ('ID', 'dtD'),
+            ('Is', 'dts'),
+            ('Ins', 'dtns'),
+            ):
+        yield f'index-{constructor}', f's(10_000,4)|i({constructor},{dtype})'
+
+    # tall, square, and wide Frames of mixed dtypes
+    for name, shape in (
+            ('tall', '100_000,4'),
+            ('square', '1_000,1_000'),
+            ('wide', '10,10_000'),
+            ):
+        yield f'shape-{name}', f's({shape})|v(int,str,float,bool)|i(I,str)|c(I,str)'
+
+def iter_cases(
+        modes: tp.Iterable[str] = MODES,
+        pattern: str = '',
+        ) -> tp.Iterator[BenchCase]:
+    '''Yield a BenchCase for each mode of each case with a name containing `pattern`.
+    '''
+    for name, dsl in iter_dsl():
+        for mode in modes:
+            if mode not in MODES:
+                raise ValueError(f'mode must be one of {MODES}: {mode!r}')
+            label = f'{name}/{mode}'
+            if pattern in label:
+                yield BenchCase(label, dsl, mode)
+
+#-------------------------------------------------------------------------------
+
+def reset() -> None:
+    '''Discard the primitive stores and all cached arrays and Frames, such that the next Fixture is created from nothing. If FRAME_FIXTURES_CACHE_DIR is set, primitives will be loaded from that directory.
+    '''
+    SourceValues.reset()
+
+def run_case(case: BenchCase,
+        repeat: int = REPEAT,
+        ) -> BenchResult:
+    '''Create the Fixture of `case` in `repeat` samples, returning the minimum of the mean time of each sample and the peak memory of one additional creation. Each sample creates the Fixture as many times as needed to take at least SECONDS_SAMPLE. Cold cases are reset before each creation (outside the time measured); warm cases are reset and created once before measurement, such that results do not depend on prior cases.
+    '''
+    cold = case.mode == 'cold'
+    if not cold:
+        reset()
+        Fixture.parse(case.dsl)
+
+    def sample(number: int) -> float:
+        total = 0.0
+        gc.collect()
+        gc.disable() # as done by timeit, exclude collections triggered by prior cases
+        try:
+            for _ in range(number):
+                if cold:
+                    reset()
+                start = perf_counter()
+                Fixture.parse(case.dsl)
+                total += perf_counter() - start
+        finally:
+            gc.enable()
+        return total
+
+    number = max(1, int(np.ceil(SECONDS_SAMPLE / max(sample(1), 1e-9))))
+    seconds = np.inf
+    for _ in range(repeat):
+        seconds = min(seconds, sample(number) / number)
+
+    if cold:
+        reset()
+    tracemalloc.start()
+    try:
+        Fixture.parse(case.dsl)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(case.name, float(seconds), peak_bytes)
+
+def run(cases: tp.Iterable[BenchCase],
+        repeat: int = REPEAT,
+        ) -> tp.Iterator[BenchResult]:
+    '''Yield a BenchResult for each case.
+    '''
+    for case in cases:
+        yield run_case(case, repeat)
+
+#-------------------------------------------------------------------------------
+
+def to_json(results: tp.Iterable[BenchResult]) -> tp.Dict[str, tp.Any]:
+    '''Return a JSON-encodable mapping of results, with the versions of the environment that created them.
+    '''
+    import static_frame as sf
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'static_frame': sf.__version__,
+            'machine': platform.machine(),
+            },
+        'cases': {r.name: {'seconds': r.seconds, 'peak_bytes': r.peak_bytes} for r in results},
+        }
+
+def read_baseline(fp: TPathSpecifier = BASELINE) -> tp.Dict[str, tp.Any]:
+    with open(fp, encoding='utf-8') as f:
+        return json.load(f) # type: ignore
+
+def write_baseline(results: tp.Iterable[BenchResult],
+        fp: TPathSpecifier = BASELINE,
+        ) -> None:
+    '''Write results to the baseline at `fp`, retaining cases of an existing baseline not in `results`.
+    '''
+    post = to_json(results)
+    if os.path.exists(fp):
+        cases = read_baseline(fp)['cases']
+        cases.update(post['cases'])
+        post['cases'] = cases
+    with open(fp, 'w', encoding='utf-8') as f:
+        json.dump(post, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+def compare(results: tp.Iterable[BenchResult],
+        baseline: tp.Dict[str, tp.Any],
+        threshold: float = THRESHOLD,
+        threshold_peak: float = THRESHOLD_PEAK,
+        ) -> tp.Iterator[BenchRegression]:
+    '''Yield a BenchRegression for each measure of each result that exceeds its baseline by more than `threshold` (for time) or `threshold_peak` (for peak memory), proportionally, and, for peak memory, by more than PEAK_BYTES_MIN. Results not in the baseline are ignored.
+    '''
+    cases = baseline['cases']
+    for result in results:
+        if result.name not in cases:
+            continue
+        for measure, proportion, minimum in (
+                ('seconds', threshold, 0),
+                ('peak_bytes', threshold_peak, PEAK_BYTES_MIN),
+                ):
+            prior = cases[result.name][measure]
+            current = getattr(result, measure)
+            if current - prior > max(prior * proportion, minimum):
+                yield BenchRegression(result.name, measure, prior, current)
+
+#-------------------------------------------------------------------------------
+
+def main(argv: tp.Optional[tp.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pattern', default='',
+            help='only run cases with names containing this string')
+    parser.add_argument('--mode', choices=MODES, action='append',
+            help='only run cases of this mode; can be given more than once')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+            help='proportional increase in time from the baseline reported as a regression')
+    parser.add_argument('--threshold-peak', type=float, default=THRESHOLD_PEAK,
+            help='proportional increase in peak memory from the baseline reported as a regression')
+    parser.add_argument('--baseline', default=BASELINE,
+            help='path to a baseline JSON file')
+    parser.add_argument('--write', action='store_true',
+            help='write results to the baseline instead of comparing')
+    args = parser.parse_args(argv)
+
+    cases = iter_cases(args.mode or MODES, args.pattern)
+    results = []
+    for result in run(cases, args.repeat):
+        print(f'{result.name:<32} {result.seconds:>10.5f} s {result.peak_bytes / 1e6:>10.3f} MB')
+        results.append(result)
+
+    if args.write:
+        write_baseline(results, args.baseline)
+        print(f'wrote baseline: {args.baseline}')
+        return 0
+
+    regressions = list(compare(results, read_baseline(args.baseline),
+            args.threshold,
+            args.threshold_peak,
+            ))
+    for r in regressions:
+        print(f'regression: {r.name} {r.measure}: {r.baseline:.5g} -> {r.current:.5g} ({r.current / r.baseline:.2f}x)')
+    if not regressions:
+        print('no regressions')
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,22 @@
+import ast
 import datetime
+import gc
+import pathlib
+import string
+import tracemalloc
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+import typing as tp
+from itertools import chain
+from itertools import islice
+from itertools import permutations
 
 import numpy as np
 import pytest
@@ -7,14 +25,38 @@ from frame_fixtures.core import Fixture
 from frame_fixtures.core import SourceValues
 from frame_fixtures.core import iter_shift
 from frame_fixtures.core import COUNT_INIT
+from frame_fixtures.core import SEED
+from frame_fixtures.core import DTYPE_OBJECT
 from frame_fixtures.core import Grammar
 from frame_fixtures.core import GrammarDoc
 # from frame_fixtures.core import parse
+from frame_fixtures.core import parse_many
 
 from frame_fixtures.core import FrameFixtureSyntaxError
 from frame_fixtures.core import repeat_count
 from frame_fixtures.core import StrToTypeInterface
 from frame_fixtures.core import DT64_UNITS
+from frame_fixtures.core import NBytesCache
+from frame_fixtures.core import CacheInfo
+from frame_fixtures.core import parse_cache
+from frame_fixtures.core import array_cache
+from frame_fixtures.core import ArrayCache
+from frame_fixtures.core import FixturePlan
+from frame_fixtures.core import compile
+from frame_fixtures.core import iter_parse
+from frame_fixtures.core import write
+from frame_fixtures.core import share
+from frame_fixtures.core import attach
+from frame_fixtures.core import detach
+from frame_fixtures.core import SharedFixture
+from frame_fixtures.core import LazyFrame
+from frame_fixtures.core import parse
+from frame_fixtures.core import profile
+from frame_fixtures.core import profile_hooks
+from frame_fixtures.core import ProfileEvent
+from frame_fixtures.core import PROFILE_KINDS
+from frame_fixtures.core import warmup
+from frame_fixtures.performance import main as performance
 
 def test_iter_shift_a() -> None:
     assert list(iter_shift(range(5), 3, wrap=True)) == [3, 4, 0, 1, 2]
@@ -35,27 +77,220 @@ def test_repeat_count_b() -> None:
 def test_source_values_a() -> None:
 
     SourceValues.update_primitives()
-    post = SourceValues._INTS
+    post = SourceValues._ints_slice(0, SourceValues._COUNT)
     assert len(post) == SourceValues._COUNT
     # assert post[:3].tolist() == [845545, 563150, 468891]
 
     size = COUNT_INIT * 2 + 1
     SourceValues.update_primitives(size)
-    assert len(SourceValues._INTS) == size * 2
-    assert len(SourceValues._CHARS) == size * 2
+    assert SourceValues._COUNT == size * 2
+    assert len(SourceValues._ints_slice(0, SourceValues._COUNT)) == size * 2
+    assert len(SourceValues._chars_slice(0, SourceValues._COUNT)) == size * 2
 
-    assert SourceValues._INTS[:4].tolist() == post[:4].tolist()
+    assert SourceValues._ints_slice(0, 4).tolist() == post[:4].tolist()
 
 
 def test_source_values_b() -> None:
 
     SourceValues.update_primitives()
-    post = SourceValues._CHARS
+    post = SourceValues._chars_slice(0, SourceValues._COUNT)
     assert len(post) == SourceValues._COUNT
     # assert post[:3].tolist() == ['fa14b27e5f09', 'ebbc39aaf008', '04e42a6ee7a9']
     # import ipdb; ipdb.set_trace()
 
 
+def get_source_values() -> tp.Type[SourceValues]:
+    '''Return a SourceValues subclass with unpopulated primitives.
+    '''
+    class SourceValuesFresh(SourceValues):
+        _COUNT = 0
+        _SEGMENTS = ()
+        _CACHE_DIR = None
+    return SourceValuesFresh
+
+def get_primitives(
+        sv: tp.Type[SourceValues],
+        ) -> tp.Tuple[tp.List[tp.Any], tp.List[tp.Any], tp.List[tp.Any]]:
+    return tuple(sv._primitives_slice(kind, 0, sv._COUNT).tolist()
+            for kind in ('ints', 'chars', 'bytes'))
+
+def test_source_values_c() -> None:
+    sv = get_source_values()
+    sv.update_primitives()
+    sv.update_primitives(COUNT_INIT * 3)
+    assert [(s.start, s.stop) for s in sv._SEGMENTS] == [
+            (0, COUNT_INIT * 2),
+            (COUNT_INIT * 2, COUNT_INIT * 6),
+            ]
+    # labels are only created when requested
+    assert sv._SEGMENTS[0].chars is None
+
+    # a slice within a segment is a view
+    post = sv._ints_slice(10, 20)
+    assert post.base is sv._SEGMENTS[0].ints
+    assert not post.flags.writeable
+
+    # a slice across segments is a concatenation
+    post = sv._chars_slice(COUNT_INIT * 2 - 2, COUNT_INIT * 2 + 2)
+    assert len(post) == 4
+    assert post.tolist() == (sv._SEGMENTS[0].chars[-2:].tolist() # type: ignore
+            + sv._SEGMENTS[1].chars[:2].tolist()) # type: ignore
+
+    assert sv._bytes_slice(0, 0).dtype == np.dtype('S4')
+
+def test_source_values_threads_a() -> None:
+    # as values depend on the positions at which primitives grow, all threads grow to the same count
+    count = 150_000
+    sv_serial = get_source_values()
+    sv_serial.update_primitives(count)
+    sv = get_source_values()
+
+    calls: tp.List[tp.Tuple[str, tp.Tuple[int, int]]] = []
+    for i in range(48):
+        stop = (i % 6 + 1) * 25_000 + i
+        calls.append((('_ints_slice', '_chars_slice', '_bytes_slice')[i % 3], (stop - 1_000, stop)))
+        calls.append(('_objects', (stop, 500)))
+
+    workers = 8
+    barrier = threading.Barrier(workers)
+
+    def call(worker: int) -> tp.List[tp.Any]:
+        barrier.wait() # start all threads together
+        # concurrent growth, label creation, and reads
+        sv.update_primitives(count)
+        return [getattr(sv, name)(*args) for name, args in calls[worker::workers]]
+
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(call, range(workers)))
+    finally:
+        sys.setswitchinterval(switch)
+
+    for worker, worker_results in enumerate(results):
+        for (name, args), result in zip(calls[worker::workers], worker_results):
+            assert result.tolist() == getattr(sv_serial, name)(*args).tolist()
+    assert [(seg.start, seg.stop) for seg in sv._SEGMENTS] == [(0, count * 2)]
+    assert sv._COUNT == count * 2
+
+
+def test_source_values_threads_b() -> None:
+    dsls = ['s(3000,4)|v(str,object)|i(IH,(str,int))', 's(20,30)|v(bytes,(int,str))|c(I,str)', 's(500,3)|v(float,bool,int)|i(ID,dtD)']
+    expected = [Fixture.parse(dsl) for dsl in dsls]
+    max_nbytes = array_cache.max_nbytes
+    switch = sys.getswitchinterval()
+    array_cache.configure(0)
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            frames = list(executor.map(Fixture.parse, dsls * 8))
+    finally:
+        sys.setswitchinterval(switch)
+        array_cache.configure(max_nbytes)
+    for f, f_expected in zip(frames, expected * 8):
+        assert f.equals(f_expected, compare_dtype=True, compare_class=True)
+
+def test_source_values_cache_a(tmp_path: pathlib.Path) -> None:
+    sv1 = get_source_values()
+    sv1.set_cache_dir(str(tmp_path))
+    sv1.update_primitives()
+    sv1.update_primitives(COUNT_INIT * 3)
+    assert len(list(tmp_path.iterdir())) == 2
+    sv1._chars_slice(0, sv1._COUNT)
+    assert len(list(tmp_path.iterdir())) == 6
+
+    # a new process would load memory-mapped arrays
+    sv2 = get_source_values()
+    sv2.set_cache_dir(str(tmp_path))
+    sv2.update_primitives()
+    assert isinstance(sv2._SEGMENTS[0].ints.base, np.memmap)
+    assert not sv2._SEGMENTS[0].ints.flags.writeable
+    sv2.update_primitives(COUNT_INIT * 3)
+
+    sv3 = get_source_values()
+    sv3.update_primitives()
+    sv3.update_primitives(COUNT_INIT * 3)
+    assert get_primitives(sv1) == get_primitives(sv2)
+    assert get_primitives(sv2) == get_primitives(sv3)
+    assert isinstance(sv2._SEGMENTS[1].chars.base, np.memmap) # type: ignore
+
+def test_source_values_cache_b(tmp_path: pathlib.Path) -> None:
+    sv1 = get_source_values()
+    sv1.set_cache_dir(str(tmp_path))
+    fp_ints = sv1._cache_fp(0, COUNT_INIT * 2, 'ints')
+    fp_chars = sv1._cache_fp(0, COUNT_INIT * 2, 'chars')
+    np.save(fp_ints, np.arange(10)) # a stale file is rejected
+    with open(fp_chars, 'w', encoding='utf-8') as f: # a corrupt file is rejected
+        f.write('foo')
+
+    sv1.update_primitives()
+    sv2 = get_source_values()
+    sv2.update_primitives()
+    assert get_primitives(sv1) == get_primitives(sv2)
+    assert np.load(fp_ints).tolist() == get_primitives(sv2)[0]
+
+def test_source_values_cache_c(tmp_path: pathlib.Path) -> None:
+    fp = tmp_path / 'file'
+    fp.write_text('foo', encoding='utf-8')
+    sv1 = get_source_values()
+    sv1.set_cache_dir(str(fp / 'sub')) # not a usable directory
+    sv1.update_primitives()
+    sv1._chars_slice(0, sv1._COUNT)
+
+    sv2 = get_source_values()
+    sv2.update_primitives()
+    assert get_primitives(sv1) == get_primitives(sv2)
+
+    # a failed replace leaves no temporary files
+    sv3 = get_source_values()
+    sv3.set_cache_dir(str(tmp_path))
+    fp_ints = pathlib.Path(sv3._cache_fp(0, COUNT_INIT * 2, 'ints'))
+    fp_ints.mkdir()
+    sv3.update_primitives()
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(['file', fp_ints.name])
+    assert get_primitives(sv3) == get_primitives(sv2)
+
+def test_source_values_cache_d(tmp_path: pathlib.Path) -> None:
+    # files of seeds other than SEED are also named by NumPy version
+    sv1 = get_source_values()
+    sv1.set_cache_dir(str(tmp_path))
+    sv2 = SourceValues.from_seed(7)
+    sv2.set_cache_dir(str(tmp_path))
+    try:
+        assert f'np{np.__version__}' not in sv1._cache_fp(0, COUNT_INIT * 2, 'ints')
+        assert f'np{np.__version__}' in sv2._cache_fp(0, COUNT_INIT * 2, 'ints')
+        sv2.update_primitives()
+        assert [p.name for p in tmp_path.iterdir()] == [pathlib.Path(sv2._cache_fp(0, COUNT_INIT * 2, 'ints')).name]
+    finally:
+        SourceValues.clear_stores()
+
+
+def test_source_values_ranks_to_codes_a() -> None:
+    alphabet = chain(
+            reversed(string.ascii_lowercase),
+            string.ascii_uppercase,
+            string.digits,
+            )
+    labels = [''.join(p) for p in islice(permutations(alphabet, 4), 300_000)]
+
+    codes = SourceValues._ranks_to_codes(np.arange(len(labels)))
+    post = SourceValues._codes_to_chars(codes)
+    assert post.dtype == np.dtype('U4')
+    assert post.tolist() == labels
+    post = SourceValues._codes_to_bytes(codes)
+    assert post.dtype == np.dtype('S4')
+    assert post.tolist() == [label.encode() for label in labels]
+
+    codes = SourceValues._ranks_to_codes(np.array([SourceValues._LABEL_COUNT - 1, 250_000, 3]))
+    post = SourceValues._codes_to_chars(codes)
+    assert post.tolist() == ['9876', labels[250_000], labels[3]]
+
+def test_source_values_ranks_to_codes_b() -> None:
+    with pytest.raises(ValueError):
+        SourceValues._ranks_to_codes(np.array([SourceValues._LABEL_COUNT]))
+
+
 def test_source_values_dtype_to_element_iter_a() -> None:
 
     for dtype in (
@@ -89,6 +324,72 @@ def test_source_values_dtype_to_element_iter_c() -> None:
             range(8),
             ))
 
+def test_source_values_dtype_to_array_a() -> None:
+    # vectorized arrays are equal to arrays collected from the element iterator
+    for dtype in (
+            np.dtype('i1'),
+            np.dtype('i'),
+            np.dtype('i8'),
+            np.dtype('u1'),
+            np.dtype('u8'),
+            np.dtype('f2'),
+            np.dtype('f8'),
+            np.dtype('c8'),
+            np.dtype('c16'),
+            np.dtype('?'),
+            np.dtype('U'),
+            np.dtype('U2'),
+            np.dtype('S'),
+            np.dtype('datetime64[D]'),
+            np.dtype('timedelta64[ns]'),
+            np.dtype('O'),
+            ):
+        for count, shift in ((0, 0), (1, 0), (20, 0), (20, 3), (500, 99)):
+            a = SourceValues.dtype_to_array(dtype, count=count, shift=shift)
+            b = SourceValues.dtype_to_array(dtype,
+                    count=count,
+                    shift=shift,
+                    gen=SourceValues.dtype_to_element_iter(dtype, count=count, shift=shift),
+                    )
+            assert a.dtype == b.dtype
+            assert not a.flags.writeable
+            if dtype.kind in ('f', 'c'):
+                assert np.array_equal(a, b, equal_nan=True)
+            else:
+                assert a.tolist() == b.tolist()
+            assert [type(v) for v in a] == [type(v) for v in b]
+
+
+def test_source_values_objects_a() -> None:
+    count = 5_000
+    a = SourceValues._objects(0, count)
+    b = SourceValues.dtype_to_array(DTYPE_OBJECT,
+            count=count,
+            gen=SourceValues.dtype_to_element_iter(DTYPE_OBJECT, count=count),
+            )
+    for start, stop in ((0, 2), (2, 4), (3, 3), (4, 40), (1_000, 1_001), (17, count)):
+        post = SourceValues._objects(start, stop - start)
+        assert post.tolist() == b[start: stop].tolist()
+        assert [type(v) for v in post] == [type(v) for v in b[start: stop]]
+    assert a.tolist() == b.tolist()
+
+def test_source_values_objects_b() -> None:
+    # chunks far from the start, crossing the groups of the first segment, equal a slice of the whole
+    sv = SourceValues.from_seed(11)
+    try:
+        sv.update_primitives(COUNT_INIT) # a first segment of 2 * COUNT_INIT groups
+        start, count = 1_190_000, 20_000
+        whole = sv._objects(start, count)
+        boundary = int(sv._SEGMENTS[0].group_ends[-1]) + 3 # type: ignore
+        assert start < boundary < start + count
+        for pos in range(0, count, 3_001):
+            post = sv._objects(start + pos, min(3_001, count - pos))
+            assert post.tolist() == whole[pos: pos + 3_001].tolist()
+            assert [type(v) for v in post] == [type(v) for v in whole[pos: pos + 3_001]]
+    finally:
+        SourceValues.clear_stores()
+
+
 def test_source_values_dtype_spec_to_array_c() -> None:
 
     a = SourceValues.dtype_spec_to_array(np.dtype('timedelta64[Y]'),
@@ -106,6 +407,31 @@ def test_source_values_dtype_spec_to_array_e() -> None:
     assert a.tolist() == [(188510, 'zlm0'), (-61878, 'zDIP'), (194249, 'zOgj')]
 
 
+def test_source_values_dtype_spec_to_array_f() -> None:
+    # complex is excluded as a complex with NaN is not equal to itself
+    dtype_spec: tp.Tuple[tp.Any, ...] = (np.int8, np.uint16, float, bool, str, bytes, object, np.dtype('datetime64[D]'))
+    for count, shift in ((0, 0), (1, 0), (40, 0), (40, 7)):
+        a = SourceValues.dtype_spec_to_array(dtype_spec, count=count, shift=shift)
+        gen = zip(*(SourceValues.dtype_to_element_iter(np.dtype(dts), count=count, shift=shift)
+                for dts in dtype_spec))
+        b = [next(gen) for _ in range(count)]
+        assert [[type(v) for v in t] for t in a] == [[type(v) for v in t] for t in b]
+        # tuples including the NaN singleton are equal by identity
+        assert a.tolist() == b
+        assert SourceValues.dtype_spec_to_take(dtype_spec, count=count, shift=shift)(
+                count // 2, count).tolist() == b[count // 2:]
+
+
+def test_source_values_dtype_spec_to_structured_array_a() -> None:
+    a = SourceValues.dtype_spec_to_structured_array((int, str, np.uint8), shift=101, count=3)
+    assert a.dtype.names == ('f0', 'f1', 'f2')
+    assert a['f1'].dtype == np.dtype('U4')
+    assert a['f0'].tolist() == [188510, -61878, 194249]
+    assert a['f1'].tolist() == ['zlm0', 'zDIP', 'zOgj']
+    assert a['f2'].tolist() == SourceValues.dtype_spec_to_array(np.uint8, shift=101, count=3).tolist()
+    assert not a.flags.writeable
+
+
 
 #-------------------------------------------------------------------------------
 def test_grammer_a() -> None:
@@ -140,6 +466,120 @@ def test_grammer_a() -> None:
     with pytest.raises(FrameFixtureSyntaxError):
         Grammar.dsl_to_str_constructors('s(3,3)|i(I,lambda x: 3)')
 
+def test_grammer_b() -> None:
+    post1 = Grammar.dsl_to_str_constructors('s(3,3)|i((I,I),(str,int))')
+    assert post1 == {'i': (('I', 'I'), ('str', 'int')), 's': (3, 3)}
+    post1['f'] = ('F',)
+
+    hits = Grammar._dsl_to_str_constructors.cache_info().hits #pylint: disable=E1120
+    post2 = Grammar.dsl_to_str_constructors('s(3,3)|i((I,I),(str,int))')
+    assert Grammar._dsl_to_str_constructors.cache_info().hits == hits + 1 #pylint: disable=E1120
+    # mutation of a returned mapping does not alter the cache
+    assert post2 == {'i': (('I', 'I'), ('str', 'int')), 's': (3, 3)}
+
+def test_grammer_c() -> None:
+    # arguments in parentheses, grouped components, and whitespace between tokens
+    post = Grammar.dsl_to_str_constructors('(s(3, (3)) | v(int,)) | i((I,), (str))')
+    assert post == {'i': (('I',), 'str'), 'v': ('int',), 's': (3, 3)}
+    post = Grammar.dsl_to_str_constructors('s(1_000,0x10)|v()|f(F)')
+    assert post == {'f': ('F',), 'v': (), 's': (1000, 16)}
+    # the first of repeated components is retained
+    assert Grammar.dsl_to_str_constructors('s(2,2)|v(int)|v(str)') == {'v': ('int',), 's': (2, 2)}
+
+def test_grammer_d() -> None:
+    for dsl, msg, offset in (
+            ('s(2,2', "expected ',' or ')'", 6),
+            ('s(2,2)|v(i@nt)', "invalid character '@'", 11),
+            ('s(2,2)|v(int) x', "expected '|'", 15),
+            ('s(2,2)|v(1.5)', "invalid character '.'", 11),
+            ('s(2,02)', "invalid integer '02'", 5),
+            ('s(2,2)|v(None)', "invalid name 'None'", 10),
+            ('s(2,2)|i(I,(str,2))', 'tuples can only contain names', 12),
+            ('s(2,2)|(v(int)|i(I,str))', 'only the first parenthesized group', 8),
+            ):
+        with pytest.raises(FrameFixtureSyntaxError, match=f'column {offset}') as e:
+            Grammar.dsl_to_str_constructors(dsl)
+        assert str(e.value).startswith(msg)
+        assert e.value.offset == offset
+        assert e.value.text == dsl
+
+def dsl_to_str_constructors_ast(dsl: str) -> tp.Dict[str, tp.Any]:
+    '''The prior parser based on the ast module, raising for any node outside of the grammar.
+    '''
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', SyntaxWarning) # as for invalid decimal literals
+        body = ast.parse(dsl).body
+    if len(body) != 1 or not isinstance(body[0], ast.Expr):
+        raise ValueError(dsl)
+    node = body[0].value
+    calls = []
+    while isinstance(node, ast.BinOp):
+        if not isinstance(node.op, ast.BitOr):
+            raise ValueError(dsl)
+        calls.append(node.right)
+        node = node.left
+    calls.append(node)
+
+    constructors: tp.Dict[str, tp.Any] = {}
+    for call in calls:
+        if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name) or call.keywords:
+            raise ValueError(dsl)
+        args: tp.List[tp.Any] = []
+        for arg in call.args:
+            if isinstance(arg, ast.Tuple) and all(isinstance(e, ast.Name) for e in arg.elts):
+                args.append(tuple(e.id for e in arg.elts)) # type: ignore
+            elif isinstance(arg, ast.Name):
+                args.append(arg.id)
+            elif isinstance(arg, ast.Constant) and type(arg.value) is int: #pylint: disable=C0123
+                args.append(arg.value)
+            else:
+                raise ValueError(dsl)
+        constructors[call.func.id] = tuple(args)
+    Grammar.validate(constructors)
+    return constructors
+
+def test_grammer_fuzz_a() -> None:
+    valid = (
+            's(2,2)',
+            's(10,4)|v(int,str)',
+            'f(Fg)|s(2,3)|i(IH,(str,int))|c(I,str)',
+            's(1_000,0)|v(bool,)',
+            '(s(2,2)|v(int))|i(I,str)',
+            's(2,2)|c((IH,IY),(str,dtY))',
+            's(2,2)|v(int)|v(str)',
+            )
+    vocabulary = (
+            's', 'v', 'i', 'c', 'f', 'I', 'IH', 'str', 'int', 'dtY', 'x',
+            '0', '00', '2', '10', '1_0', '01',
+            '(', ')', ',', '|', '((', '))',
+            '.', '+', '-', '*', '=', ':', '[', ']', '@', "'a'", '1.5',
+            'None', 'True', 'lambda', '0x1', '_',
+            )
+    rng = random.Random(42)
+    for _ in range(3000):
+        tokens = Grammar._TOKEN.findall(rng.choice(valid))
+        for _ in range(rng.randint(0, 3)):
+            pos = rng.randrange(len(tokens) + 1)
+            mutation = rng.randrange(3)
+            if mutation == 0:
+                tokens.insert(pos, rng.choice(vocabulary))
+            elif pos < len(tokens):
+                if mutation == 1:
+                    del tokens[pos]
+                else:
+                    tokens[pos] = rng.choice(vocabulary)
+        dsl = ''.join(t + rng.choice(('', '', ' ')) for t in tokens)
+
+        try:
+            expected = dsl_to_str_constructors_ast(dsl)
+        except Exception: #pylint: disable=W0703
+            with pytest.raises(FrameFixtureSyntaxError):
+                Grammar.dsl_to_str_constructors(dsl)
+            continue
+        post = Grammar.dsl_to_str_constructors(dsl)
+        assert post == expected, dsl
+        assert list(post) == list(expected), dsl
+
 #-------------------------------------------------------------------------------
 
 
@@ -198,6 +638,15 @@ def test_str_type_interface_a() -> None:
         _ = stti['foo']
 
 
+def test_str_type_interface_b() -> None:
+    import static_frame as sf
+    stti1 = StrToTypeInterface.from_module()
+    assert StrToTypeInterface.from_module() is stti1
+    stti2 = StrToTypeInterface.from_module(sf)
+    assert StrToTypeInterface.from_module(sf) is stti2
+    assert stti2['F'] is sf.Frame
+
+
 #-------------------------------------------------------------------------------
 def test_import() -> None:
 
@@ -216,6 +665,707 @@ def test_grammar_definition() -> None:
 
 
 #-------------------------------------------------------------------------------
+def test_nbytes_cache_a() -> None:
+    cache = NBytesCache()
+    cache.set('a', 'x', 1) # disabled
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+    cache.configure(10)
+    cache.set('a', 'x', 4)
+    cache.set('b', 'y', 4)
+    assert cache.get('a') == 'x' # b is now least-recently used
+    cache.set('c', 'z', 4)
+    assert cache.get('b') is None
+    assert cache.cache_info() == CacheInfo(hits=1, misses=2, evictions=1, currsize=2, nbytes=8, max_nbytes=10)
+
+    cache.set('d', 'w', 11) # too large to store
+    assert cache.get('d') is None
+    cache.configure(4)
+    assert cache.get('c') == 'z'
+    assert cache.cache_info().nbytes == 4
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, evictions=0, currsize=0, nbytes=0, max_nbytes=4)
+
+    with pytest.raises(ValueError):
+        cache.configure(-1)
+
+
+def test_array_cache_a() -> None:
+    cache = ArrayCache(800)
+    a1 = SourceValues.dtype_spec_to_array(int, count=50, shift=3)
+    cache.set_array(int, 3, a1)
+    assert cache.get_array(int, 51, 3) is a1 # shorter, counted as a miss
+    a2 = cache.get_array(int, 20, 3)
+    assert a2 is not None and a2.base is a1 and not a2.flags.writeable
+    assert cache.get_array(int, 50, 3) is a1
+
+    # a smaller array does not replace a larger array
+    cache.set_array(int, 3, a2)
+    assert cache.get_array(int, 50, 3) is a1
+    assert cache.cache_info() == CacheInfo(hits=3, misses=1, evictions=0, currsize=1, nbytes=400, max_nbytes=800)
+
+    cache.set_array(int, 4, SourceValues.dtype_spec_to_array(int, count=60, shift=4))
+    assert cache.get_array(int, 10, 3) is None # evicted
+    assert cache.cache_info().nbytes == 480
+
+
+def test_array_cache_b() -> None:
+    array_cache.clear()
+    dtype_specs: tp.List[tp.Any] = [object, (int, float, str), float, np.dtype('datetime64[s]')]
+    for dtype_spec in dtype_specs:
+        for shift in (0, 31):
+            for count in (10, 100, 1_000):
+                a = SourceValues.dtype_spec_to_array(dtype_spec, count=count, shift=shift)
+                b = SourceValues._dtype_spec_to_array(dtype_spec, count, shift)
+                assert a.dtype == b.dtype
+                assert [type(v) for v in a] == [type(v) for v in b]
+                assert (a.tolist() == b.tolist()) if dtype_spec is not float else np.array_equal(a, b, equal_nan=True)
+    assert array_cache.cache_info().currsize == 8
+
+
+def test_array_cache_c() -> None:
+    max_nbytes = array_cache.max_nbytes
+    try:
+        array_cache.configure(10_000)
+        array_cache.clear()
+        a1 = SourceValues.dtype_spec_to_array(str, count=100, shift=7)
+        a2 = SourceValues.dtype_spec_to_array(str, count=10, shift=7)
+        assert a2.base is a1
+        assert a2.tolist() == SourceValues.dtype_to_array(np.dtype(str), count=10, shift=7).tolist()
+        assert array_cache.cache_info().hits == 1
+        assert SourceValues.dtype_spec_to_array(str, count=0, shift=7).dtype == np.dtype('U1')
+
+        # only values beyond the canonical array are created
+        a4 = SourceValues.dtype_spec_to_array(str, count=150, shift=7)
+        assert a4[:100].tolist() == a1.tolist()
+        assert a4.tolist() == SourceValues.dtype_to_array(np.dtype(str), count=150, shift=7).tolist()
+        assert SourceValues.dtype_spec_to_array(str, count=100, shift=7).base is a4
+        assert array_cache.cache_info().currsize == 1
+
+        array_cache.configure(0) # disables
+        a3 = SourceValues.dtype_spec_to_array(str, count=10, shift=7)
+        assert a3.base is not a4
+        assert len(array_cache) == 0
+    finally:
+        array_cache.configure(max_nbytes)
+
+def test_parse_cache_a() -> None:
+    parse_cache.configure(2 ** 20)
+    try:
+        f1 = Fixture.parse('s(20,4)|v(int,str)|i(I,str)')
+        f2 = Fixture.parse(' s(20, 4) | v(int, str) | i(I, str)')
+        assert f1 is f2
+        assert parse_cache.cache_info().hits == 1
+        # whitespace within tokens is not ignored
+        with pytest.raises(FrameFixtureSyntaxError):
+            Fixture.parse('s(2 0,4)|v(int,str)|i(I,str)')
+        with pytest.raises(FrameFixtureSyntaxError):
+            Fixture.parse('s(20,4)|v(in t,str)|i(I,str)')
+
+        f3 = Fixture.parse('s(2000,40)')
+        assert parse_cache.cache_info().nbytes == f1.nbytes + f3.nbytes
+        parse_cache.configure(f3.nbytes)
+        assert Fixture.parse('s(20,4)|v(int,str)|i(I,str)') is not f1
+        assert parse_cache.cache_info().evictions == 2
+    finally:
+        parse_cache.configure(0)
+        parse_cache.clear()
+
+def test_parse_cache_b() -> None:
+    parse_cache.configure(2 ** 20)
+    try:
+        f1 = Fixture.parse('f(Fg)|s(4,2)|c(IHg,(str,int))')
+        f2 = Fixture.parse('f(Fg)|s(4,2)|c(IHg,(str,int))')
+        assert f1 is not f2
+        f1[('a', 1)] = 0 # type: ignore
+        f3 = Fixture.parse('f(Fg)|s(4,2)|c(IHg,(str,int))')
+        assert f3.shape == f2.shape == (4, 2)
+        assert f3.equals(f2, compare_dtype=True, compare_class=True)
+        assert f3.columns.__class__ is f1.columns.__class__
+    finally:
+        parse_cache.configure(0)
+        parse_cache.clear()
+
+
+#-------------------------------------------------------------------------------
+def test_profile_a() -> None:
+    array_cache.clear()
+    with profile() as p:
+        f = Fixture.parse('s(20,5)|v(int,str,object)|i(IH,(str,int))|c(I,str)')
+    assert profile_hooks.hooks == ()
+    assert list(p.phases) == ['dsl', 'shifts', 'values', 'type_blocks', 'index', 'columns', 'frame']
+    assert all(s >= 0 for s in p.phases.values())
+    # object columns are created once and filled into a block, others are created for each column
+    assert [e.name for e in p.columns] == ['0', '1', '2', '3', '4']
+    assert p.nbytes == 20 * (8 + 16 + 8 + 8 + 16)
+    assert p.cache['array_cache.miss'] > 0
+    assert {e.kind for e in p.events} <= set(PROFILE_KINDS)
+
+    with profile() as p:
+        f2 = Fixture.parse('s(20,5)|v(int,str,object)|i(IH,(str,int))|c(I,str)', workers=3)
+    assert f2.equals(f, compare_dtype=True)
+    assert sorted(e.name for e in p.columns) == ['0', '1', '2', '3', '4']
+    assert 'array_cache.miss' not in p.cache
+
+    sv = get_source_values()
+    with profile() as p:
+        sv.update_primitives()
+        sv._chars_slice(0, 10)
+        sv._chars_slice(0, 10)
+    assert [(e.name, e.nbytes) for e in p.growth] == [
+            ('ints[0:200000]', COUNT_INIT * 2 * 8),
+            ('labels[0:200000]', COUNT_INIT * 2 * (16 + 4)),
+            ]
+
+def test_profile_b() -> None:
+    events: tp.List[ProfileEvent] = []
+    parse_cache.configure(2 ** 20)
+    try:
+        with profile(events.append) as p1:
+            Fixture.parse('s(3,2)|v(bool)')
+            with profile() as p2:
+                Fixture.parse('s(3,2)|v(bool)')
+    finally:
+        parse_cache.configure(0)
+        parse_cache.clear()
+
+    assert events == p1.events
+    assert p2.events == [ProfileEvent('cache', 'parse_cache.hit', 0.0, 0)]
+    assert p1.cache['parse_cache.miss'] == 1
+    assert p1.cache['parse_cache.hit'] == 1
+    assert repr(p2) == '<Profile: events=1>'
+
+    with pytest.raises(ValueError):
+        profile_hooks.remove(events.append)
+    assert profile_hooks.hooks == ()
+
+
+#-------------------------------------------------------------------------------
+def import_times(module: str) -> tp.Dict[str, int]:
+    '''Return the cumulative microseconds to import each module imported by importing `module` in a new interpreter.
+    '''
+    root = str(pathlib.Path(__file__).parents[2])
+    post = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=dict(os.environ, PYTHONPATH=root),
+            )
+    times = {}
+    for line in post.stderr.splitlines():
+        if line.startswith('import time:') and not line.endswith('imported package'):
+            _, cumulative, name = line[len('import time:'):].split('|')
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_import_time_a() -> None:
+    times = import_times('frame_fixtures')
+    assert 'numpy' not in times
+    assert 'frame_fixtures.core' not in times
+    # nothing is imported other than modules imported at startup
+    assert set(times) - set(import_times('sys')) == {'frame_fixtures'}
+
+    times = import_times('frame_fixtures.core')
+    assert 'numpy' in times
+    for module in ('static_frame', 'zipfile', 'json', 'multiprocessing', 'concurrent.futures'):
+        assert module not in times
+
+def test_import_time_b() -> None:
+    import frame_fixtures as ff
+    assert 'parse' in dir(ff)
+    assert ff.parse is parse
+    assert ff.warmup is warmup
+    with pytest.raises(AttributeError):
+        ff.foo # pylint: disable=W0104
+
+def test_source_values_reset_a() -> None:
+    SourceValues.reset()
+    f1 = Fixture.parse('s(20,4)|v(int,str)')
+    SourceValues.from_seed(7)
+    SourceValues.reset()
+    assert SourceValues._COUNT == 0
+    assert not SourceValues._SEGMENTS
+    assert not SourceValues._STORES
+    assert len(array_cache) == 0
+    f2 = Fixture.parse('s(20,4)|v(int,str)')
+    assert f2.equals(f1, compare_dtype=True, compare_class=True)
+
+def test_warmup_a() -> None:
+    warmup()
+    assert SourceValues._COUNT >= COUNT_INIT * 2
+    assert all(s.chars is not None and s.bytes is not None for s in SourceValues._SEGMENTS)
+
+
+#-------------------------------------------------------------------------------
+def test_fixture_plan_a() -> None:
+    fp = compile('s(6,5)|v(int8,str,bool,bool,(int,str))|i(I,str)|c(IH,(str,int))')
+    assert isinstance(fp, FixturePlan)
+    assert fp.shape == (6, 5)
+
+    f = fp.execute()
+    assert f.equals(Fixture.parse('s(6,5)|v(int8,str,bool,bool,(int,str))|i(I,str)|c(IH,(str,int))'),
+            compare_dtype=True,
+            compare_class=True,
+            )
+    assert fp.dtypes == tuple(f.dtypes.values)
+    assert fp.nbytes == sum(a.nbytes for a in f._blocks._blocks)
+    assert [(dt, stop - start) for dt, start, stop in fp.block_layout] == [
+            (a.dtype, 1 if a.ndim == 1 else a.shape[1]) for a in f._blocks._blocks]
+
+def test_fixture_plan_b() -> None:
+    fp = compile('f(Fg)|s(2,3)|v(float,str)|c(Ig,int)')
+    for shape in ((4, 3), (2, 7), (0, 2), (2, 3)):
+        f1 = fp.execute(shape)
+        f2 = Fixture.parse(f'f(Fg)|s({shape[0]},{shape[1]})|v(float,str)|c(Ig,int)')
+        assert f1.shape == shape
+        assert f1.equals(f2, compare_dtype=True, compare_class=True)
+        assert fp.with_shape(shape).dtypes == tuple(f1.dtypes.values)
+    assert fp.shape == (2, 3)
+
+
+def test_build_type_blocks_a() -> None:
+    str_to_type = StrToTypeInterface.from_module()
+    shape = (20_000, 40)
+    dtype_specs = (float, float, float, str, bool, bool, int)
+
+    def legacy() -> tp.Any:
+        shifts = Fixture._shifts(shape[1])
+        return str_to_type['TB'].from_blocks(
+                SourceValues.dtype_spec_to_array(
+                        dtype_specs[col % len(dtype_specs)],
+                        count=shape[0],
+                        shift=shifts[col],
+                        ) for col in range(shape[1])).consolidate()
+
+    def direct() -> tp.Any:
+        return Fixture._build_type_blocks(shape, dtype_specs, str_to_type)
+
+    peaks = []
+    tbs = []
+    for func in (legacy, direct):
+        array_cache.clear()
+        tracemalloc.start()
+        tbs.append(func())
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    tb_legacy, tb = tbs
+    assert peaks[1] < peaks[0]
+    assert tb.equals(tb_legacy, compare_dtype=True)
+    assert tb.shapes.tolist() == tb_legacy.shapes.tolist()
+    assert not any(b.flags.writeable for b in tb._blocks)
+
+
+def test_build_type_blocks_workers_a() -> None:
+    for dsl in (
+            's(100,12)|v(float,float,str,bytes,bool,object,(int,str),int8)|i(I,str)|c(I,int)',
+            'f(Fg)|s(20,30)|v(str)',
+            's(4,1)|v(int)',
+            ):
+        f1 = Fixture.parse(dsl)
+        array_cache.clear()
+        f2 = Fixture.parse(dsl, workers=4)
+        assert f2.equals(f1, compare_dtype=True, compare_class=True)
+        assert f2._blocks.shapes.tolist() == f1._blocks.shapes.tolist()
+
+#-------------------------------------------------------------------------------
+def test_parse_many_a() -> None:
+    dsls = (
+            's(100,12)|v(float,str,bool,(int,str))|i(I,str)',
+            'f(Fg)|s(20,30)|v(str)|c(Ig,int)',
+            's(100,12)|v(float,str,bool,(int,str))|c(IH,(str,int))',
+            ' s(100, 12) | v(float,str,bool,(int,str)) | i(I,str)',
+            'f(Fg)|s(20,30)|v(str)|c(Ig,int)',
+            )
+    for workers in (1, 4):
+        array_cache.clear()
+        frames = parse_many(dsls, workers=workers)
+        assert len(frames) == len(dsls)
+        for dsl, f in zip(dsls, frames):
+            assert f.equals(parse(dsl), compare_dtype=True, compare_class=True)
+        # an immutable Frame is created once; a grow-only Frame is copied
+        assert frames[0] is frames[3]
+        assert frames[1] is not frames[4]
+        assert frames[1].equals(frames[4])
+    assert not parse_many(())
+    # whitespace within tokens is not ignored
+    for dsl in ('s(1 0,2)', 's(2,2)|v(in t)'):
+        with pytest.raises(FrameFixtureSyntaxError):
+            parse_many([dsl])
+
+def test_parse_many_b() -> None:
+    parse_cache.configure(2 ** 20)
+    try:
+        dsls = ('s(20,4)|v(int,str)', 'f(Fg)|s(4,2)')
+        f1, f2 = parse_many(dsls)
+        assert parse_cache.cache_info().misses == 2
+        f3, f4 = parse_many(dsls)
+        assert parse_cache.cache_info().hits == 2
+        assert f3 is f1
+        assert f4 is not f2 and f4.equals(f2)
+    finally:
+        parse_cache.configure(0)
+        parse_cache.clear()
+
+def test_parse_many_c() -> None:
+    plans = [
+            compile('s(100,12)|v(float,str)'),
+            compile('s(100,4)|v(float,str)|i(I,str)'),
+            compile('s(50,4)|v(float,str)'),
+            ]
+    arrays = Fixture._shared_arrays(plans)
+    # only the first four columns of the first two plans are the same
+    shifts = plans[0].shifts()
+    assert set(arrays) == {(plans[0].dtype_specs[col % 2], 100, shifts[col]) for col in range(4)}
+    for (dtype_spec, count, shift), array in arrays.items():
+        assert array.tolist() == SourceValues.dtype_spec_to_array(dtype_spec, count, shift).tolist()
+
+def test_parse_many_d() -> None:
+    # values depend on the growth of primitives, so each Frame is created in a new interpreter
+    root = str(pathlib.Path(__file__).parents[2])
+    dsl = 's(300000,3)|v(int,str,object)|i(I,str)'
+    digests = []
+    for func in ('parse', 'lambda dsl: parse_many([dsl])[0]'):
+        post = subprocess.run([sys.executable, '-c',
+                'import hashlib, pickle\n'
+                'from frame_fixtures import parse, parse_many\n'
+                f'print(hashlib.sha256(pickle.dumps(({func})({dsl!r}))).hexdigest())\n'
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=dict(os.environ, PYTHONPATH=root),
+                )
+        digests.append(post.stdout)
+    assert digests[0] == digests[1]
+
+#-------------------------------------------------------------------------------
+def test_seed_a() -> None:
+    assert SourceValues.from_seed() is SourceValues
+    assert SourceValues.from_seed(SEED) is SourceValues
+    sv = SourceValues.from_seed(7)
+    assert sv is SourceValues.from_seed(7)
+    assert sv is not SourceValues.from_seed(8)
+    for seed in (-1, 1.5, True, '7', np.int64(-1), np.bool_(True), np.float64(7)):
+        with pytest.raises(ValueError):
+            SourceValues.from_seed(seed) # type: ignore
+    # NumPy integers select the same store
+    assert SourceValues.from_seed(np.int64(7)) is sv # type: ignore
+    assert SourceValues.from_seed(np.uint8(SEED)) is SourceValues # type: ignore
+
+    segments = SourceValues._SEGMENTS
+    state = np.random.get_state()[1].tolist() # type: ignore
+    sv.update_primitives()
+    # an independent store, shuffled with a Generator, mutating neither the default store nor the global RandomState
+    assert SourceValues._SEGMENTS is segments
+    assert np.random.get_state()[1].tolist() == state # type: ignore
+    assert sv._ints_slice(0, 20).tolist() == np.random.default_rng(7).permutation(COUNT_INIT * 2)[:20].tolist()
+    assert SourceValues._ints_slice(0, 20).tolist() == np.random.RandomState(SEED).permutation(COUNT_INIT * 2)[:20].tolist()
+
+    # released stores are created again, with the same values
+    SourceValues.clear_stores()
+    assert not SourceValues._STORES
+    sv_new = SourceValues.from_seed(7)
+    assert sv_new is not sv
+    assert sv_new._ints_slice(0, 20).tolist() == sv._ints_slice(0, 20).tolist()
+
+def test_seed_b() -> None:
+    dsl = 'f(Fg)|s(20,6)|v(int,float,str,bool,(int,str),object)|i(IH,(str,dtD))|c(Ig,str)'
+    f1 = parse(dsl)
+    f2 = parse(dsl, seed=7)
+    assert not f2.equals(f1)
+    assert not f2.index.equals(f1.index)
+    assert parse(dsl, seed=8).equals(parse(dsl, seed=8), compare_dtype=True, compare_class=True)
+    assert parse(dsl, seed=np.int64(7)).equals(f2, compare_dtype=True, compare_class=True) # type: ignore
+    assert parse(dsl).equals(f1, compare_dtype=True, compare_class=True)
+
+    # every means of creation takes values from the same store
+    for f in (
+            parse(dsl, seed=7, workers=4),
+            parse(dsl, seed=7, lazy=True).to_frame(),
+            Fixture.parse(dsl, seed=7),
+            compile(dsl, seed=7).execute(),
+            parse_many([dsl, 's(4,4)'], seed=7)[0],
+            f2.__class__.from_concat(iter_parse(dsl, chunk_rows=7, seed=7)),
+            ):
+        assert f.equals(f2, compare_dtype=True, compare_class=True)
+    assert repr(compile(dsl, seed=7)) == '<FixturePlan: shape=(20, 6) seed=7>'
+
+def test_seed_c(tmp_path: pathlib.Path) -> None:
+    dsl = 's(20,6)|v(int,float,str,bool)|i(ID,dtD)|c(I,str)'
+    f1 = parse(dsl, seed=7)
+    fp = tmp_path / 'f.npz'
+    write(dsl, fp, chunk_rows=4, seed=7)
+    assert f1.__class__.from_npz(fp).equals(f1, compare_dtype=True, compare_class=True)
+    with share(dsl, seed=7) as sfx:
+        assert attach(sfx.descriptor).equals(f1, compare_dtype=True, compare_class=True)
+
+    parse_cache.configure(2 ** 20)
+    try:
+        # cached arrays and Frames are distinct per seed
+        f2 = parse(dsl)
+        f3 = parse(dsl, seed=7)
+        assert f3.equals(f1) and not f3.equals(f2)
+        assert parse(dsl, seed=SEED) is f2
+        assert parse_cache.cache_info().hits == 1
+    finally:
+        parse_cache.configure(0)
+        parse_cache.clear()
+
+def test_seed_d() -> None:
+    # a store created again after clear_stores() does not use arrays or Frames cached from the released store
+    parse_cache.configure(2 ** 24)
+    try:
+        parse('v(int)|s(300000,1)', seed=5)
+        SourceValues.clear_stores()
+        parse('v(int)|s(500000,1)', seed=5)
+        f1 = parse('v(int)|s(300000,1)', seed=5)
+        parse_cache.clear()
+        array_cache.clear()
+        f2 = parse('v(int)|s(300000,1)', seed=5)
+        assert f1.equals(f2, compare_dtype=True)
+    finally:
+        parse_cache.configure(0)
+        parse_cache.clear()
+        SourceValues.clear_stores()
+
+
+def test_iter_parse_a() -> None:
+    for dsl in (
+            's(10,5)|v(int,str,bool,float,object)',
+            'f(Fg)|s(9,4)|v(float,float,(int,str),dtD)|i(IH,(str,int,object))|c(Ig,str)',
+            's(13,3)|v(bytes,bytes,uint16)|i(ID,dtD)|c((I,I),(int,str))',
+            's(6,2)|i(IH,(object,str))',
+            ):
+        f = Fixture.parse(dsl)
+        for chunk_rows in (2, 3, 5, 100):
+            parts = list(iter_parse(dsl, chunk_rows))
+            assert [p.shape[0] for p in parts] == [
+                    min(chunk_rows, f.shape[0] - i) for i in range(0, f.shape[0], chunk_rows)]
+            start = 0
+            for part in parts:
+                assert part.equals(f.iloc[start: start + part.shape[0]],
+                        compare_dtype=True,
+                        compare_class=True,
+                        )
+                start += part.shape[0]
+
+def test_iter_parse_b() -> None:
+    dsl = 's(50_000,20)|v(int,float,str,bool)|i(I,str)'
+    size = Fixture.parse(dsl).nbytes
+
+    tracemalloc.start()
+    for part in Fixture.iter_parse(dsl, chunk_rows=1_000):
+        assert part.shape == (1_000, 20)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < size / 4
+
+    with pytest.raises(ValueError):
+        next(iter_parse(dsl, 0))
+
+
+def test_write_npz_a(tmp_path: pathlib.Path) -> None:
+    for dsl in (
+            's(20,6)|v(int,float,float,str,bool,dtD)|i(IH,(str,int))|c(I,str)',
+            'f(Fg)|s(7,3)|v(bytes,complex)',
+            's(9,4)|i(ID,dtD)|c(IH,(str,int))',
+            ):
+        f1 = Fixture.parse(dsl)
+        fp = tmp_path / 'f.npz'
+        write(dsl, fp, chunk_rows=4)
+        f2 = f1.__class__.from_npz(fp)
+        assert f2.equals(f1, compare_dtype=True, compare_class=True)
+        assert f2._blocks.shapes.tolist() == f1._blocks.shapes.tolist()
+
+def test_write_npz_b(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError):
+        write('s(4,2)|v(object)', tmp_path / 'f.npz')
+    with pytest.raises(ValueError):
+        write('s(4,2)', tmp_path / 'f.csv', format='csv')
+
+def test_write_arrow_a(tmp_path: pathlib.Path) -> None:
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+
+    dsl = 's(25,4)|v(int,str,bool,float)|i(I,str)|c(I,str)'
+    f = Fixture.parse(dsl)
+
+    write(dsl, tmp_path / 'f.parquet', format='parquet', chunk_rows=10)
+    f.to_parquet(tmp_path / 'g.parquet')
+    table = pq.read_table(tmp_path / 'f.parquet')
+    assert table.equals(pq.read_table(tmp_path / 'g.parquet'))
+    assert pq.ParquetFile(tmp_path / 'f.parquet').num_row_groups == 3
+
+    write(dsl, tmp_path / 'f.arrow', format='arrow', chunk_rows=10)
+    assert pa.ipc.open_file(tmp_path / 'f.arrow').read_all().equals(f.to_arrow())
+
+
+def attach_to_pairs(descriptor: tp.Any) -> tp.Any:
+    f = attach(descriptor)
+    assert not any(b.flags.writeable for b in f._blocks._blocks)
+    return f.to_pairs()
+
+def test_shared_fixture_a() -> None:
+    dsl = 's(20,6)|v(int,float,float,str,object,bool)|i(IH,(str,int))|c(I,str)'
+    f1 = Fixture.parse(dsl)
+
+    with share(dsl) as sfx:
+        assert isinstance(sfx, SharedFixture)
+        f2 = attach(sfx.descriptor)
+        f3 = attach(sfx.descriptor)
+        assert f2.equals(f1, compare_dtype=True, compare_class=True)
+        assert f2._blocks.shapes.tolist() == f1._blocks.shapes.tolist()
+        assert np.shares_memory(f2._blocks._blocks[1], f3._blocks._blocks[1])
+
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as executor:
+            assert executor.submit(attach_to_pairs, sfx.descriptor).result() == f1.to_pairs()
+
+    with pytest.raises(FileNotFoundError):
+        attach(sfx.descriptor)
+
+    # attached Frames remain usable after release
+    assert f2.iloc[-1].equals(f1.iloc[-1])
+    assert f3.equals(f1, compare_dtype=True)
+    del f2, f3
+    gc.collect()
+    assert not SharedFixture._ARRAYS
+    assert not SharedFixture._CLOSING
+
+def test_shared_fixture_b() -> None:
+    with pytest.raises(Exception):
+        share('s(3,0)')
+    with SharedFixture.from_dsl('f(Fg)|s(0,2)|c(Ig,str)') as sfx:
+        f = attach(sfx.descriptor)
+        assert f.__class__ is Fixture.parse('f(Fg)|s(0,2)|c(Ig,str)').__class__
+        assert f.shape == (0, 2)
+
+def test_shared_fixture_c() -> None:
+    dsl = 's(10,3)|v(int,float,str)|i(I,int)'
+    f1 = Fixture.parse(dsl)
+    with share(dsl) as sfx:
+        names = [s.name for s in sfx.descriptor.blocks]
+        f2 = attach(sfx.descriptor)
+        detach(sfx.descriptor)
+        assert not any(name in SharedFixture._ATTACHED for name in names)
+        assert f2.equals(f1, compare_dtype=True)
+
+        # attaching again maps the segments again
+        f3 = attach(sfx.descriptor)
+        assert all(name in SharedFixture._ATTACHED for name in names)
+        del f2
+        gc.collect()
+        assert f3.equals(f1, compare_dtype=True)
+
+    assert f3.iloc[-1].equals(f1.iloc[-1])
+    del f3
+    gc.collect()
+    assert not SharedFixture._ARRAYS
+    assert not SharedFixture._CLOSING
+
+
+def test_lazy_frame_a() -> None:
+    import static_frame as sf
+
+    dsl = 'f(Fg)|s(6,8)|i(IH,(str,int))|c(IHg,(str,dtD))|v(int,str,object,(int,bool))'
+    lf = parse(dsl, lazy=True)
+    f = parse(dsl)
+    assert lf.shape == f.shape
+    assert lf.index.equals(f.index, compare_class=True, compare_dtype=True)
+    assert lf.columns.equals(f.columns, compare_class=True, compare_dtype=True)
+    assert lf.dtypes.equals(f.dtypes, compare_dtype=True)
+    assert lf.materialized == ()
+
+    labels = list(f.columns)
+    for key in (labels[5], [labels[7], labels[2]], sf.HLoc[f.columns.values_at_depth(0)[0]]):
+        assert lf[key].equals(f[key], compare_class=True, compare_dtype=True, compare_name=True)
+    assert lf.materialized == (0, 1, 2, 5, 7)
+
+    assert lf.to_frame().equals(f, compare_class=True, compare_dtype=True)
+    assert lf.to_frame() is lf.to_frame()
+    assert lf.iloc[-1].equals(f.iloc[-1])
+
+
+def test_lazy_frame_b() -> None:
+    lf = LazyFrame.from_dsl('s(4,3)|c(I,str)')
+    f = Fixture.parse('s(4,3)|c(I,str)')
+    assert lf[[]].shape == (4, 0)
+    assert lf[f.columns.values[1]].equals(f[f.columns.values[1]], compare_class=True)
+    assert len(lf) == 4
+    assert repr(lf) == '<LazyFrame: shape=(4, 3)>'
+    with pytest.raises(KeyError):
+        lf['?'] # pylint: disable=W0104
+    with pytest.raises(AttributeError):
+        lf._foo # pylint: disable=W0104,W0212
+
+
+#-------------------------------------------------------------------------------
+def test_performance_a(tmp_path: pathlib.Path) -> None:
+    cases = list(performance.iter_cases(pattern='dtype-str/'))
+    assert [c.name for c in cases] == ['dtype-str/cold', 'dtype-str/warm']
+    assert len(set(c.name for c in performance.iter_cases())) == len(list(performance.iter_cases()))
+    with pytest.raises(ValueError):
+        list(performance.iter_cases(modes=('hot',)))
+
+    f1 = Fixture.parse('s(20,4)|v(str,int)')
+    results = list(performance.run(cases, repeat=1))
+    assert [r.name for r in results] == ['dtype-str/cold', 'dtype-str/warm']
+    assert all(r.seconds > 0 and r.peak_bytes > 0 for r in results)
+    # a reset store creates the same values
+    assert Fixture.parse('s(20,4)|v(str,int)').equals(f1, compare_dtype=True)
+
+    fp = tmp_path / 'baseline.json'
+    performance.write_baseline(results, fp)
+    performance.write_baseline(results[:1], fp)
+    baseline = performance.read_baseline(fp)
+    assert sorted(baseline['cases']) == ['dtype-str/cold', 'dtype-str/warm']
+    assert not list(performance.compare(results, baseline))
+
+    slow = performance.BenchResult('dtype-str/cold', results[0].seconds + 1, results[0].peak_bytes)
+    large = performance.BenchResult('dtype-str/warm', results[1].seconds, results[1].peak_bytes * 2 + 100_000)
+    new = performance.BenchResult('dtype-foo/cold', 1.0, 1)
+    assert [(r.name, r.measure) for r in performance.compare((slow, large, new), baseline)] == [
+            ('dtype-str/cold', 'seconds'),
+            ('dtype-str/warm', 'peak_bytes'),
+            ]
+    # short cases are compared proportionally
+    slow = performance.BenchResult('dtype-str/warm', results[1].seconds * 10, results[1].peak_bytes)
+    assert [(r.name, r.measure) for r in performance.compare((slow,), baseline)] == [('dtype-str/warm', 'seconds')]
+
+
+#-------------------------------------------------------------------------------
+def test_build_index_a() -> None:
+    str_to_type = StrToTypeInterface()
+    dtype_specs: tp.List[tp.Any] = [(str, int), (bool, object, np.dtype('datetime64[D]')), (object, (int, str))]
+    for dtype_spec in dtype_specs:
+        ih: tp.Any = Fixture._build_index(13, str_to_type['IH'], dtype_spec, str_to_type)
+        # labels as created by zipping repeated labels of each depth
+        repeats = (4, 2, 1)[-len(dtype_spec):]
+        gens: tp.List[tp.Any] = [repeat_count(SourceValues.dtype_spec_to_array(dts, count=13, shift=10 * i), repeats[i])
+                for i, dts in enumerate(dtype_spec)]
+        labels = [tuple(next(g) for g in gens) for _ in range(13)]
+        ih_labels = str_to_type['IH'].from_labels(labels, index_constructors=str_to_type['IACF'])
+        assert ih.equals(ih_labels, compare_class=True, compare_dtype=True)
+        assert ih.dtypes.values.tolist() == ih_labels.dtypes.values.tolist()
+
+def test_build_index_b() -> None:
+    str_to_type = StrToTypeInterface()
+    # the dtypes of depths of objects, discovered from a bounded number of labels, are those of all labels
+    dtype_specs: tp.List[tp.Any] = [(object, object), (str, object, object), ((int, str), object)]
+    for dtype_spec in dtype_specs:
+        repeats = (4, 2, 1)[-len(dtype_spec):]
+        for count in range(1, 60):
+            ih: tp.Any = Fixture._build_index(count, str_to_type['IH'], dtype_spec, str_to_type)
+            gens: tp.List[tp.Any] = [repeat_count(SourceValues.dtype_spec_to_array(dts, count=count, shift=10 * i), repeats[i])
+                    for i, dts in enumerate(dtype_spec)]
+            labels = [tuple(next(g) for g in gens) for _ in range(count)]
+            ih_labels = str_to_type['IH'].from_labels(labels, index_constructors=str_to_type['IACF'])
+            assert ih.dtypes.values.tolist() == ih_labels.dtypes.values.tolist()
+
+
 def test_index_dt64_a() -> None:
 
     for u in DT64_UNITS:
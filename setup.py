@@ -78,5 +78,9 @@ setup(
     keywords='dataframe fixtures test staticframe pandas numpy',
     packages=[
             'frame_fixtures',
+            'frame_fixtures.performance',
             ],
+    package_data={
+            'frame_fixtures.performance': ['baseline.json'],
+            },
     )
\ No newline at end of file
@@ -71,6 +71,25 @@ def coverage(context):
     webbrowser.open('htmlcov/index.html')
 
 
+@invoke.task
+def bench(context,
+        pattern='',
+        write=False,
+        threshold=None,
+        ):
+    '''Run benchmarks and compare to the stored baseline; with --write, store results as the baseline.
+    '''
+    cmd = f'{sys.executable} -m frame_fixtures.performance.main'
+    if pattern:
+        cmd += f' --pattern {pattern}'
+    if write:
+        cmd += ' --write'
+    if threshold is not None:
+        cmd += f' --threshold {threshold}'
+    print(cmd)
+    context.run(cmd)
+
+
 @invoke.task
 def mypy(context):
     '''Run mypy static analysis.